@@ -2,11 +2,129 @@
 import time
 import math
 import heapq
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.colors import ListedColormap
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; astar() falls back to pure Python
+    njit = None
+
+try:
+    from _dary_heap import dary_pop, dary_push
+except ImportError:  # Imported as part of the Graphs_Algo package
+    from ._dary_heap import dary_pop, dary_push
+
+try:
+    from _astar_cy import CAStar
+except ImportError:
+    try:  # Imported as part of the Graphs_Algo package
+        from ._astar_cy import CAStar
+    except ImportError:  # C extension is optional; build with cythonize -i _astar_cy.pyx
+        CAStar = None
+
+
+def _jit(fn):
+    """Compile fn with Numba when it is installed, otherwise return it as-is."""
+    return njit(cache=True)(fn) if njit is not None else fn
+
+
+# Neighbor offsets: 4 straight moves first, then the 4 diagonals
+_DX = np.array([0, 1, 0, -1, -1, 1, 1, -1], np.int32)
+_DY = np.array([1, 0, -1, 0, 1, 1, -1, -1], np.int32)
+
+
+@_jit
+def _astar_core(obstacle, heuristic, sx, sy, gx, gy, straight_cost, diagonal_cost,
+                index_dtype, counter_dtype):
+    """
+    A* search over a uint8 obstacle grid with cells encoded as x*cols+y.
+    heuristic is the (rows, cols) table from AStarPathfinder.heuristic_table.
+    index_dtype / counter_dtype size the cell-index and heap-counter arrays
+    (see AStarPathfinder.__init__); Numba compiles one variant per pair.
+    Mirrors AStarPathfinder._astar_python exactly: a re-queued cell takes
+    the (f, counter) key of its newest push, which is the entry the heapq
+    search pops once it has skipped the stale ones.
+    Returns (parent, g_scores, discovered, n_discovered, expanded, n_expanded, found).
+    """
+    rows, cols = obstacle.shape
+    size = rows * cols
+    INF = np.inf
+    obstacle_flat = obstacle.ravel()
+    heuristic_flat = heuristic.ravel()
+
+    g_scores = np.full(size, INF, np.float64)
+    parent = np.full(size, -1, index_dtype)
+    explored = np.zeros(size, np.uint8)
+    seen = np.zeros(size, np.uint8)
+    discovered = np.empty(size, index_dtype)
+    expanded = np.empty(size, index_dtype)
+
+    # Indexed heap: a better g replaces the queued entry's key in place
+    # instead of pushing a duplicate, so each cell is in the heap at most
+    # once and pops never see stale entries
+    heap_f = np.empty(size, np.float64)
+    heap_c = np.empty(size, counter_dtype)
+    heap_idx = np.empty(size, index_dtype)
+    heap_pos = np.full(size, -1, index_dtype)
+
+    urows = np.uint32(rows)
+    ucols = np.uint32(cols)
+    # Per-expansion scratch for the two-pass neighbor scan
+    nb_all = np.empty(8, np.int32)
+    valid = np.empty(8, np.uint8)
+
+    start = sx * cols + sy
+    goal = gx * cols + gy
+    g_scores[start] = 0.0
+    seen[start] = 1
+    discovered[0] = start
+    n_discovered = 1
+    n_expanded = 0
+
+    heap_size = dary_push(heap_f, heap_c, heap_idx, heap_pos, 0, heuristic[sx, sy], 0, start)
+    counter = 1
+
+    while heap_size > 0:
+        cur, heap_size = dary_pop(heap_f, heap_c, heap_idx, heap_pos, heap_size)
+        explored[cur] = 1
+        expanded[n_expanded] = cur
+        n_expanded += 1
+        if cur == goal:
+            return parent, g_scores, discovered, n_discovered, expanded, n_expanded, True
+
+        x = cur // cols
+        y = cur - x * cols
+        current_g = g_scores[cur]
+        # Pass 1: branch-free bounds test for all 8 offsets at once.
+        # A negative coordinate wraps to a huge uint32, so one unsigned
+        # compare per axis covers both the < 0 and >= size cases
+        for k in range(8):
+            nx = x + _DX[k]
+            ny = y + _DY[k]
+            valid[k] = (np.uint32(nx) < urows) & (np.uint32(ny) < ucols)
+            nb_all[k] = nx * cols + ny
+        # Pass 2: obstacle / closed checks and relaxation for the survivors
+        for k in range(8):
+            if not valid[k]:
+                continue
+            nb = nb_all[k]
+            if obstacle_flat[nb] or explored[nb]:
+                continue
+            tentative_g = current_g + (straight_cost if k < 4 else diagonal_cost)
+            if tentative_g < g_scores[nb]:
+                g_scores[nb] = tentative_g
+                parent[nb] = cur
+                heap_size = dary_push(heap_f, heap_c, heap_idx, heap_pos, heap_size,
+                                       tentative_g + heuristic_flat[nb], counter, nb)
+                counter += 1
+                if not seen[nb]:
+                    seen[nb] = 1
+                    discovered[n_discovered] = nb
+                    n_discovered += 1
+
+    return parent, g_scores, discovered, n_discovered, expanded, n_expanded, False
+
+
 class AStarPathfinder:
     """
     Optimized A* Algorithm Implementation
@@ -21,10 +139,17 @@ class AStarPathfinder:
         obstacles: list of (row, col) tuples representing blocked cells
         """
         self.rows, self.cols = grid
-        # Use 2D array for obstacles instead of set/dict
-        self.obstacle_grid = [[False] * self.cols for _ in range(self.rows)]
-        for r, c in obstacles:
-            self.obstacle_grid[r][c] = True
+        # Boolean obstacle grid, and the same grid wrapped in a one-cell
+        # blocked border so a single lookup covers both the bounds check
+        # and the obstacle check; reset() refills both in place
+        self.obstacle_np = np.zeros((self.rows, self.cols), dtype=np.bool_)
+        self._padded = np.ones((self.rows + 2, self.cols + 2), dtype=np.bool_)
+        # Narrowest integer types for the compiled kernel's per-cell index
+        # arrays (-1 sentinel included) and its heap tie-break counter,
+        # which is bumped at most 8 times per cell
+        size = self.rows * self.cols
+        self._index_dtype = np.int16 if size <= np.iinfo(np.int16).max else np.int32
+        self._counter_dtype = np.int32 if 8 * size < np.iinfo(np.int32).max else np.int64
         self.straight_cost = float(straight_cost)
         self.diagonal_cost = float(diagonal_cost)
         self._directions = [
@@ -37,6 +162,34 @@ class AStarPathfinder:
             (1, -1, self.diagonal_cost),
             (-1, -1, self.diagonal_cost),
         ]
+        # Same directions as flat-index offsets: (offset in the grid,
+        # offset in the padded grid, move cost)
+        self._flat_offsets = [(dx * self.cols + dy, dx * (self.cols + 2) + dy, cost)
+                              for dx, dy, cost in self._directions]
+        self.reset(obstacles)
+    
+    def reset(self, obstacles):
+        """
+        Replace the obstacles, keeping the grid size and move costs.
+        Lets one pathfinder search many layouts of the same grid: the
+        obstacle arrays are refilled in place rather than reallocated.
+        """
+        # Filled with a single fancy-indexed write
+        self.obstacle_np.fill(False)
+        if len(obstacles):
+            obs = np.asarray(obstacles, dtype=np.intp)
+            self.obstacle_np[obs[:, 0], obs[:, 1]] = True
+        padded = self._padded
+        padded[1:-1, 1:-1] = self.obstacle_np
+        # Nested-list views for the Python search (scalar list indexing is
+        # much cheaper than NumPy element access from the interpreter)
+        self.obstacle_grid = self.obstacle_np.tolist()
+        self._blocked_padded = padded.tolist()
+        # Flat copy of the padded grid for the inlined neighbor loops
+        self._blocked_flat = padded.ravel().tolist()
+        # Compiled C search, when the Cython extension has been built
+        self._c = (CAStar(self.obstacle_np, self.straight_cost, self.diagonal_cost)
+                   if CAStar is not None else None)
     
     def heuristic(self, node, goal):
         """
@@ -47,6 +200,17 @@ class AStarPathfinder:
         dy = abs(node[1] - goal[1])
         dmin, dmax = min(dx, dy), max(dx, dy)
         return self.diagonal_cost * dmin + self.straight_cost * (dmax - dmin)
+
+    def heuristic_table(self, goal):
+        """
+        Heuristic of every cell towards goal as a (rows, cols) float64 array.
+        Computed once per search so the inner loop does a lookup instead of
+        a heuristic() call for each neighbor.
+        """
+        dx = np.abs(np.arange(self.rows, dtype=np.int32)[:, None] - goal[0])
+        dy = np.abs(np.arange(self.cols, dtype=np.int32)[None, :] - goal[1])
+        dmin = np.minimum(dx, dy)
+        return self.diagonal_cost * dmin + self.straight_cost * (np.maximum(dx, dy) - dmin)
     
     def get_neighbors(self, node):
         """
@@ -54,152 +218,610 @@ class AStarPathfinder:
         """
         x, y = node
         neighbors = []
+        # Padded grid is offset by one: cell (nx, ny) lives at [nx + 1][ny + 1]
+        blocked = self._blocked_padded
         for dx, dy, move_cost in self._directions:
             nx, ny = x + dx, y + dy
-            # Check if neighbor is within grid bounds and not an obstacle
-            if (0 <= nx < self.rows and 0 <= ny < self.cols and 
-                not self.obstacle_grid[nx][ny]):
+            # Out-of-bounds cells fall on the blocked border
+            if not blocked[nx + 1][ny + 1]:
                 neighbors.append(((nx, ny), move_cost))
         
         return neighbors
     
-    def astar(self, start, goal):
+    def astar(self, start, goal, record_trace=False):
         """
         Optimized A* algorithm using arrays and a binary heap.
+        Runs the Cython extension when it has been built, else the
+        Numba-compiled kernel when Numba is installed, otherwise the
+        equivalent pure-Python search.
+        record_trace: fill 'explored_nodes' / 'expanded_nodes' with the
+        visit order (for visualization); otherwise they are left empty
+        and only the counts are reported.
         Time Complexity: O(V log V) where V is number of vertices
         Space Complexity: O(V)
         Returns: dictionary with path, metrics
         """
+        if self._c is not None or njit is not None:
+            return self._astar_compiled(start, goal, record_trace)
+        return self._astar_python(start, goal, record_trace)
+
+    def _unflatten(self, cells):
+        """Convert flat cell indices back to (row, col) tuples."""
+        cols = self.cols
+        return [divmod(v, cols) for v in cells]
+
+    def _astar_compiled(self, start, goal, record_trace=False):
+        """
+        Thin wrapper around CAStar.astar_c / _astar_core: converts flat
+        cell indices back to (row, col) tuples and builds the result dictionary.
+        """
+        start_time = time.time()
+        if self._c is not None:
+            parent, g_scores, discovered, n_disc, expanded, n_exp, found = self._c.astar_c(
+                self.heuristic_table(goal), start[0], start[1], goal[0], goal[1])
+        else:
+            parent, g_scores, discovered, n_disc, expanded, n_exp, found = _astar_core(
+                self.obstacle_np, self.heuristic_table(goal),
+                start[0], start[1], goal[0], goal[1],
+                self.straight_cost, self.diagonal_cost,
+                self._index_dtype, self._counter_dtype)
+
+        cols = self.cols
+        path = []
+        if found:
+            current = goal[0] * cols + goal[1]
+            while current != -1:
+                path.append(divmod(int(current), cols))
+                current = parent[current]
+            path.reverse()
+        end_time = time.time()
+
+        # The kernel always fills the int arrays; tuples only on request
+        if record_trace:
+            discovered_list = self._unflatten(discovered[:n_disc].tolist())
+            expanded_list = self._unflatten(expanded[:n_exp].tolist())
+        else:
+            discovered_list, expanded_list = [], []
+        return {
+            'path': path,
+            'nodes_explored': int(n_disc),
+            'nodes_expanded': int(n_exp),
+            'execution_time_ms': (end_time - start_time) * 1000,
+            'path_length': len(path),
+            'total_cost': float(g_scores[goal[0] * cols + goal[1]]) if found else float('inf'),
+            'success': bool(found),
+            'explored_nodes': discovered_list,
+            'expanded_nodes': expanded_list,
+            'algorithm': 'A*'
+        }
+
+    def _astar_python(self, start, goal, record_trace=False):
+        """
+        Pure-Python A* search used when Numba is not available.
+        Per-cell state lives in flat lists indexed by x * cols + y.
+        With record_trace the visit order is kept as flat indices and
+        converted to tuples once, on return.
+        """
         start_time = time.time()
+        cols = self.cols
+        size = self.rows * cols
         
-        h_start = self.heuristic(start, goal)
-        # Min-heap entries: (f_score, g_score, row, col)
-        open_heap = [(h_start, 0.0, start[0], start[1])]
+        # Heuristic lookup table (flat list indexes faster than NumPy here)
+        H = self.heuristic_table(goal).ravel().tolist()
+        start_idx = start[0] * cols + start[1]
+        goal_idx = goal[0] * cols + goal[1]
+        # Min-heap entries: (f_score, counter, cell, g_score)
+        # The monotonic counter breaks f-ties in FIFO order, so tuple
+        # comparison never has to look past the second field.
+        open_heap = [(H[start_idx], 0, start_idx, 0.0)]
+        counter = 1
         
-        # Use 2D arrays instead of dictionaries for O(1) access
+        # Flat arrays instead of dictionaries or nested lists: one index
+        # per access and a single list object per array
         INF = float('inf')
         # g_score: distance from start to each node
-        g_scores = [[INF] * self.cols for _ in range(self.rows)]
-        g_scores[start[0]][start[1]] = 0
+        g_scores = [INF] * size
+        g_scores[start_idx] = 0.0
         
-        # To reconstruct the path
-        parent = [[None] * self.cols for _ in range(self.rows)]
+        # To reconstruct the path (-1 = no parent)
+        parent = [-1] * size
+        blocked = self._blocked_flat
+        offsets = self._flat_offsets
         
         # Track expanded nodes (popped from heap)
-        explored = [[False] * self.cols for _ in range(self.rows)]
+        explored = [False] * size
         nodes_expanded = 0
-        expanded_list = []
+        expanded_trace = []
 
         # Track discovered nodes (seen and inserted/updated in open list)
-        discovered = [[False] * self.cols for _ in range(self.rows)]
-        discovered[start[0]][start[1]] = True
-        discovered_list = [start]
+        discovered = [False] * size
+        discovered[start_idx] = True
+        nodes_discovered = 1
+        discovered_trace = [start_idx]
         
         while open_heap:
-            current_f, current_g, x, y = heapq.heappop(open_heap)
+            current_f, _, current, current_g = heapq.heappop(open_heap)
 
             # Skip stale queue entries or already explored nodes
-            if explored[x][y]:
+            if explored[current]:
                 continue
-            if current_g > g_scores[x][y]:
+            if current_g > g_scores[current]:
                 continue
 
-            current_node = (x, y)
-            
-            explored[x][y] = True
+            explored[current] = True
             nodes_expanded += 1
-            expanded_list.append((x, y))
+            if record_trace:
+                expanded_trace.append(current)
             
             # Goal found - early exit
-            if current_node == goal:
+            if current == goal_idx:
                 end_time = time.time()
                 path = self._reconstruct_path(parent, start, goal)
                 
                 return {
                     'path': path,
-                    'nodes_explored': len(discovered_list),
+                    'nodes_explored': nodes_discovered,
                     'nodes_expanded': nodes_expanded,
                     'execution_time_ms': (end_time - start_time) * 1000,
                     'path_length': len(path),
                     'total_cost': current_g,
                     'success': True,
-                    'explored_nodes': discovered_list,
-                    'expanded_nodes': expanded_list,
+                    'explored_nodes': self._unflatten(discovered_trace) if record_trace else [],
+                    'expanded_nodes': self._unflatten(expanded_trace),
                     'algorithm': 'A*'
                 }
             
-            # Explore neighbors
-            for neighbor, move_cost in self.get_neighbors(current_node):
-                nx, ny = neighbor
-                if not explored[nx][ny]:
+            # Explore neighbors (get_neighbors inlined: bounds, obstacle,
+            # closed check, relaxation and push in one pass per offset)
+            padded_current = current + 2 * (current // cols) + cols + 3
+            for offset, padded_offset, move_cost in offsets:
+                # Out-of-bounds cells fall on the blocked border
+                if blocked[padded_current + padded_offset]:
+                    continue
+                nb = current + offset
+                if not explored[nb]:
                     tentative_g = current_g + move_cost
                     
                     # Only update if we found a better path
-                    if tentative_g < g_scores[nx][ny]:
-                        g_scores[nx][ny] = tentative_g
-                        parent[nx][ny] = current_node
-                        h_score = self.heuristic(neighbor, goal)
-                        f_score = tentative_g + h_score
-                        heapq.heappush(open_heap, (f_score, tentative_g, nx, ny))
+                    if tentative_g < g_scores[nb]:
+                        g_scores[nb] = tentative_g
+                        parent[nb] = current
+                        f_score = tentative_g + H[nb]
+                        heapq.heappush(open_heap, (f_score, counter, nb, tentative_g))
+                        counter += 1
 
                         # Mark node once when it is first discovered.
-                        if not discovered[nx][ny]:
-                            discovered[nx][ny] = True
-                            discovered_list.append(neighbor)
+                        if not discovered[nb]:
+                            discovered[nb] = True
+                            nodes_discovered += 1
+                            if record_trace:
+                                discovered_trace.append(nb)
         
         # No path found
         end_time = time.time()
         return {
             'path': [],
-            'nodes_explored': len(discovered_list),
+            'nodes_explored': nodes_discovered,
             'nodes_expanded': nodes_expanded,
             'execution_time_ms': (end_time - start_time) * 1000,
             'path_length': 0,
             'total_cost': INF,
             'success': False,
-            'explored_nodes': discovered_list,
-            'expanded_nodes': expanded_list,
+            'explored_nodes': self._unflatten(discovered_trace) if record_trace else [],
+            'expanded_nodes': self._unflatten(expanded_trace),
             'algorithm': 'A*'
         }
     
+    def bidirectional_astar(self, start, goal):
+        """
+        Bidirectional A*: one frontier grows from start (heuristic towards
+        goal), the other from goal (heuristic towards start), alternating
+        pops. mu tracks the cheapest start-goal path seen where the two
+        searches touch; the search stops once the smaller open f-value on
+        either side can no longer beat mu.
+        Time Complexity: O(V log V) where V is number of vertices
+        Space Complexity: O(V)
+        Returns: dictionary with path, metrics (same keys as astar)
+        """
+        start_time = time.time()
+        INF = float('inf')
+        cols = self.cols
+        size = self.rows * cols
+        start_idx = start[0] * cols + start[1]
+        goal_idx = goal[0] * cols + goal[1]
+
+        # Index 0 = forward search (from start), 1 = backward search (from goal)
+        # Per-cell state is flat, indexed by x * cols + y
+        h_tables = (self.heuristic_table(goal).ravel().tolist(),
+                    self.heuristic_table(start).ravel().tolist())
+        g_scores = ([INF] * size, [INF] * size)
+        parents = ([-1] * size, [-1] * size)
+        closed = ([False] * size, [False] * size)
+        blocked = self._blocked_flat
+        offsets = self._flat_offsets
+        g_scores[0][start_idx] = 0.0
+        g_scores[1][goal_idx] = 0.0
+        heaps = ([(h_tables[0][start_idx], 0, start_idx, 0.0)],
+                 [(h_tables[1][goal_idx], 1, goal_idx, 0.0)])
+        counter = 2
+
+        # Discovered by either search (union), for visualization
+        discovered = [False] * size
+        discovered[start_idx] = True
+        discovered[goal_idx] = True
+        discovered_list = [start] if start == goal else [start, goal]
+        expanded_list = []
+        nodes_expanded = 0
+
+        mu = 0.0 if start == goal else INF
+        meet = start_idx if start == goal else -1
+
+        side = 0
+        while heaps[0] and heaps[1]:
+            # Both open lists are ordered by f = g + h with a consistent h,
+            # so the larger of the two minimum f-values bounds any path
+            # that has not been found yet
+            if max(heaps[0][0][0], heaps[1][0][0]) >= mu:
+                break
+
+            heap = heaps[side]
+            g_side, g_other = g_scores[side], g_scores[1 - side]
+            parent_side, closed_side = parents[side], closed[side]
+            h_side = h_tables[side]
+
+            current_f, _, current, current_g = heapq.heappop(heap)
+            if closed_side[current] or current_g > g_side[current]:
+                side = 1 - side
+                continue
+
+            x, y = divmod(current, cols)
+            closed_side[current] = True
+            nodes_expanded += 1
+            expanded_list.append((x, y))
+
+            padded_current = current + 2 * x + cols + 3
+            for offset, padded_offset, move_cost in offsets:
+                if blocked[padded_current + padded_offset]:
+                    continue
+                nb = current + offset
+                if closed_side[nb]:
+                    continue
+                tentative_g = current_g + move_cost
+                if tentative_g < g_side[nb]:
+                    g_side[nb] = tentative_g
+                    parent_side[nb] = current
+                    f_score = tentative_g + h_side[nb]
+                    heapq.heappush(heap, (f_score, counter, nb, tentative_g))
+                    counter += 1
+
+                    if not discovered[nb]:
+                        discovered[nb] = True
+                        discovered_list.append(divmod(nb, cols))
+
+                    # The two searches touch at this neighbor
+                    candidate = tentative_g + g_other[nb]
+                    if candidate < mu:
+                        mu = candidate
+                        meet = nb
+
+            side = 1 - side
+
+        end_time = time.time()
+        if meet == -1:
+            return {
+                'path': [],
+                'nodes_explored': len(discovered_list),
+                'nodes_expanded': nodes_expanded,
+                'execution_time_ms': (end_time - start_time) * 1000,
+                'path_length': 0,
+                'total_cost': INF,
+                'success': False,
+                'explored_nodes': discovered_list,
+                'expanded_nodes': expanded_list,
+                'algorithm': 'Bidirectional A*'
+            }
+
+        # start -> meet from the forward tree, meet -> goal from the backward tree
+        path = self._reconstruct_path(parents[0], start, divmod(meet, cols))
+        current = parents[1][meet]
+        while current != -1:
+            path.append(divmod(current, cols))
+            current = parents[1][current]
+
+        return {
+            'path': path,
+            'nodes_explored': len(discovered_list),
+            'nodes_expanded': nodes_expanded,
+            'execution_time_ms': (end_time - start_time) * 1000,
+            'path_length': len(path),
+            'total_cost': g_scores[0][meet] + g_scores[1][meet],
+            'success': True,
+            'explored_nodes': discovered_list,
+            'expanded_nodes': expanded_list,
+            'algorithm': 'Bidirectional A*'
+        }
+
     def _reconstruct_path(self, parent, start, goal):
         """
-        Reconstruct path from start to goal using 2D parent array
+        Reconstruct path from start to goal using the flat parent array
+        (cells are x * cols + y, -1 marks the start)
         """
+        cols = self.cols
         path = []
-        current = goal
-        while current is not None:
-            path.append(current)
-            x, y = current
-            current = parent[x][y]
+        current = goal[0] * cols + goal[1]
+        while current != -1:
+            path.append(divmod(current, cols))
+            current = parent[current]
         path.reverse()
         return path
 
+class JPSPathfinder(AStarPathfinder):
+    """
+    Jump Point Search on the same 8-direction grid as AStarPathfinder.
+    Straight and diagonal runs are scanned without touching the open list;
+    only jump points (cells with a forced neighbor, or the goal) are pushed.
+    Optimal for the usual costs (diagonal_cost between straight_cost and
+    2 * straight_cost), where symmetric paths really are interchangeable.
+    """
+
+    def reset(self, obstacles):
+        super().reset(obstacles)
+        # Padded grid packed into one Python int per row and per column
+        # (bit j = padded cell j), so a straight run is scanned with a few
+        # whole-line bit operations instead of one lookup per cell
+        self._row_scan = self._pack_lines(self._padded)
+        self._col_scan = self._pack_lines(self._padded.T)
+
+    @staticmethod
+    def _pack_lines(padded):
+        """
+        Per line i: (blocked bits, forced bits going +1, forced bits going -1).
+        A forced bit j marks a side cell (line i - 1 or i + 1) that is
+        blocked while the next side cell along the run is open.
+        """
+        lines = [int.from_bytes(line.tobytes(), 'little')
+                 for line in np.packbits(padded, axis=1, bitorder='little')]
+        packed = [(lines[0], 0, 0)]
+        for before, line, after in zip(lines, lines[1:], lines[2:]):
+            packed.append((line,
+                           (before & ~(before >> 1)) | (after & ~(after >> 1)),
+                           (before & ~(before << 1)) | (after & ~(after << 1))))
+        packed.append((lines[-1], 0, 0))
+        return packed
+
+    @staticmethod
+    def _scan(line, forced, j, step, goal_j):
+        """
+        Straight run along a packed line from padded position j in
+        direction step (+1 / -1). Returns the padded position of the next
+        jump point (forced neighbor or goal_j), or None if a blocked cell
+        comes first. The blocked border guarantees the run ends.
+        """
+        if goal_j >= 0:
+            forced |= 1 << goal_j
+        if step > 0:
+            ahead = line >> (j + 1)
+            stops = forced >> (j + 1)
+            if stops and (stops & -stops) < (ahead & -ahead):
+                return (stops & -stops).bit_length() + j
+            return None
+        behind = (1 << j) - 1
+        stop = (forced & behind).bit_length() - 1
+        return stop if stop > (line & behind).bit_length() - 1 else None
+
+    def _jump(self, x, y, dx, dy, goal):
+        """
+        Walk from (x, y) in direction (dx, dy) and return the flat index
+        (x * cols + y) of the next jump point, or -1 if the run hits an
+        obstacle or the grid edge.
+        """
+        gx, gy = goal
+        cols = self.cols
+        if not dx:
+            line, forced_pos, forced_neg = self._row_scan[x + 1]
+            hit = self._scan(line, forced_pos if dy > 0 else forced_neg,
+                             y + 1, dy, gy + 1 if x == gx else -1)
+            return -1 if hit is None else x * cols + hit - 1
+        if not dy:
+            line, forced_pos, forced_neg = self._col_scan[y + 1]
+            hit = self._scan(line, forced_pos if dx > 0 else forced_neg,
+                             x + 1, dx, gx + 1 if y == gy else -1)
+            return -1 if hit is None else (hit - 1) * cols + y
+
+        # Flat padded grid: cell (x, y) lives at (x + 1) * (cols + 2) + y + 1
+        blocked = self._blocked_flat
+        row_step = dx * (cols + 2)
+        p = (x + 1) * (cols + 2) + y + 1
+        while True:
+            x += dx
+            y += dy
+            p += row_step + dy
+            if blocked[p]:
+                return -1
+            if x == gx and y == gy:
+                return x * cols + y
+            # Diagonal: forced neighbor behind either blocked side
+            if ((blocked[p - row_step] and not blocked[p - row_step + dy]) or
+                    (blocked[p - dy] and not blocked[p + row_step - dy])):
+                return x * cols + y
+            # A straight run from here reaching a jump point makes this one
+            if self._jump(x, y, dx, 0, goal) >= 0 or self._jump(x, y, 0, dy, goal) >= 0:
+                return x * cols + y
+
+    def _pruned_directions(self, x, y, px, py):
+        """
+        Directions worth scanning from (x, y) when reached from (px, py):
+        the natural neighbors plus any forced ones. All 8 for the start.
+        """
+        if px < 0:
+            return [(dx, dy) for dx, dy, _ in self._directions]
+        blocked = self._blocked_padded
+        dx = (x > px) - (x < px)
+        dy = (y > py) - (y < py)
+        if dx and dy:
+            dirs = [(dx, 0), (0, dy), (dx, dy)]
+            if blocked[x - dx + 1][y + 1]:
+                dirs.append((-dx, dy))
+            if blocked[x + 1][y - dy + 1]:
+                dirs.append((dx, -dy))
+        elif dx:
+            dirs = [(dx, 0)]
+            if blocked[x + 1][y + 2]:
+                dirs.append((dx, 1))
+            if blocked[x + 1][y]:
+                dirs.append((dx, -1))
+        else:
+            dirs = [(0, dy)]
+            if blocked[x + 2][y + 1]:
+                dirs.append((1, dy))
+            if blocked[x][y + 1]:
+                dirs.append((-1, dy))
+        return dirs
+
+    def _identify_successors(self, x, y, px, py, goal):
+        """
+        Yield (jump_point, cost) for every jump point reachable from (x, y);
+        jump points are flat cell indices.
+        """
+        cols = self.cols
+        straight_cost, diagonal_cost = self.straight_cost, self.diagonal_cost
+        for dx, dy in self._pruned_directions(x, y, px, py):
+            point = self._jump(x, y, dx, dy, goal)
+            if point >= 0:
+                # Octile distance of the run: it is straight or diagonal,
+                # so the step count is the larger coordinate delta
+                jx, jy = divmod(point, cols)
+                steps = max(abs(jx - x), abs(jy - y))
+                yield point, steps * (diagonal_cost if dx and dy else straight_cost)
+
+    def jps(self, start, goal):
+        """
+        Jump Point Search from start to goal.
+        Explored/expanded nodes are jump points; the returned path is
+        expanded back to every cell so it matches astar() output.
+        Returns: dictionary with path, metrics (same keys as astar)
+        """
+        start_time = time.time()
+        cols = self.cols
+        size = self.rows * cols
+
+        H = self.heuristic_table(goal).ravel().tolist()
+        start_idx = start[0] * cols + start[1]
+        goal_idx = goal[0] * cols + goal[1]
+        # Min-heap entries: (f_score, counter, cell, g_score)
+        open_heap = [(H[start_idx], 0, start_idx, 0.0)]
+        counter = 1
+
+        INF = float('inf')
+        g_scores = [INF] * size
+        g_scores[start_idx] = 0.0
+        parent = [-1] * size
+        explored = [False] * size
+        nodes_expanded = 0
+        expanded_list = []
+        discovered = [False] * size
+        discovered[start_idx] = True
+        discovered_list = [start_idx]
+
+        while open_heap:
+            current_f, _, current, current_g = heapq.heappop(open_heap)
+            if explored[current]:
+                continue
+            if current_g > g_scores[current]:
+                continue
+
+            x, y = divmod(current, cols)
+            explored[current] = True
+            nodes_expanded += 1
+            expanded_list.append(current)
+
+            if current == goal_idx:
+                end_time = time.time()
+                path = self._expand_path(self._reconstruct_path(parent, start, goal))
+                return {
+                    'path': path,
+                    'nodes_explored': len(discovered_list),
+                    'nodes_expanded': nodes_expanded,
+                    'execution_time_ms': (end_time - start_time) * 1000,
+                    'path_length': len(path),
+                    'total_cost': current_g,
+                    'success': True,
+                    'explored_nodes': self._unflatten(discovered_list),
+                    'expanded_nodes': self._unflatten(expanded_list),
+                    'algorithm': 'JPS'
+                }
+
+            p = parent[current]
+            px, py = divmod(p, cols) if p != -1 else (-1, -1)
+            for nb, move_cost in self._identify_successors(x, y, px, py, goal):
+                if explored[nb]:
+                    continue
+                tentative_g = current_g + move_cost
+                if tentative_g < g_scores[nb]:
+                    g_scores[nb] = tentative_g
+                    parent[nb] = current
+                    heapq.heappush(open_heap, (tentative_g + H[nb], counter, nb, tentative_g))
+                    counter += 1
+                    if not discovered[nb]:
+                        discovered[nb] = True
+                        discovered_list.append(nb)
+
+        end_time = time.time()
+        return {
+            'path': [],
+            'nodes_explored': len(discovered_list),
+            'nodes_expanded': nodes_expanded,
+            'execution_time_ms': (end_time - start_time) * 1000,
+            'path_length': 0,
+            'total_cost': INF,
+            'success': False,
+            'explored_nodes': self._unflatten(discovered_list),
+            'expanded_nodes': self._unflatten(expanded_list),
+            'algorithm': 'JPS'
+        }
+
+    def _expand_path(self, jump_points):
+        """
+        Fill in the straight/diagonal cells between consecutive jump points
+        """
+        if not jump_points:
+            return []
+        path = [jump_points[0]]
+        for (x0, y0), (x1, y1) in zip(jump_points, jump_points[1:]):
+            dx = (x1 > x0) - (x1 < x0)
+            dy = (y1 > y0) - (y1 < y0)
+            x, y = x0, y0
+            while (x, y) != (x1, y1):
+                x += dx
+                y += dy
+                path.append((x, y))
+        return path
+
 def visualize_pathfinding(rows, cols, obstacles, start, goal, result):
     """
     Visualize the pathfinding process using matplotlib
     """
+    # Only this function plots; importing pyplot here keeps it out of
+    # astar_gui and animate_astar, which import AStarPathfinder
+    import matplotlib.pyplot as plt
+    import matplotlib.patches as patches
+    from matplotlib.colors import ListedColormap
+
     # Create figure and axis
     fig, ax = plt.subplots(figsize=(12, 10))
     
     # Create grid visualization
-    grid = np.zeros((rows, cols))
+    grid = np.zeros((rows, cols), dtype=np.uint8)
     
-    # Mark obstacles (value = 1)
-    for obs in obstacles:
-        grid[obs[0]][obs[1]] = 1
-    
-    # Mark explored nodes (value = 2)
-    if 'explored_nodes' in result:
-        for node in result['explored_nodes']:
-            if node != start and node != goal:
-                grid[node[0]][node[1]] = 2
-    
-    # Mark path (value = 3)
-    if result['success']:
-        for node in result['path']:
-            if node != start and node != goal:
-                grid[node[0]][node[1]] = 3
+    # Mark obstacles (value = 1), explored nodes (value = 2) and the path
+    # (value = 3) with one indexed write per layer. Start and goal are
+    # painted last, so they need not be filtered out of the layers
+    layers = ((obstacles, 1),
+              (result.get('explored_nodes', []), 2),
+              (result['path'] if result['success'] else [], 3))
+    for cells, value in layers:
+        cells = np.asarray(cells, dtype=np.intp).reshape(-1, 2)
+        grid[cells[:, 0], cells[:, 1]] = value
     
     # Mark start (value = 4) and goal (value = 5)
     grid[start[0]][start[1]] = 4
@@ -211,7 +833,7 @@ def visualize_pathfinding(rows, cols, obstacles, start, goal, result):
     cmap = ListedColormap(colors)
     
     # Plot the grid
-    im = ax.imshow(grid, cmap=cmap, interpolation='nearest', origin='upper')
+    im = ax.imshow(grid, cmap=cmap, interpolation='nearest', origin='upper', vmin=0, vmax=5)
     
     # Add grid lines
     ax.set_xticks(np.arange(-0.5, cols, 1), minor=True)
@@ -259,149 +881,150 @@ def run_astar_analysis():
     """
     Main function to run A* algorithm with user input
     """
-    print("\n" + "=" * 80)
-    print("A* ALGORITHM - PATH FINDING RESEARCH ANALYSIS")
-    print("=" * 80)
-    print("Straight Move Cost: 1.0")
-    print(f"Diagonal Move Cost: {math.sqrt(2.0):.4f}")
-    print("Movement: 8-directional (up, down, left, right + diagonals)")
-    print("Heuristic: Octile-style distance")
-    print("=" * 80)
-    
-    # Get grid dimensions
-    print("\n📐 GRID SETUP")
-    print("-" * 80)
-    rows = int(input("Enter number of rows: "))
-    cols = int(input("Enter number of columns: "))
-    print(f"✓ Grid size: {rows} x {cols} ({rows * cols} total cells)")
-    
-    # Get obstacles
-    print("\n🚧 OBSTACLES SETUP")
-    print("-" * 80)
-    print("Enter obstacles as 'row,col' (one per line)")
-    print("Type 'done' when finished")
-    print("Example: 1,2")
-    
-    obstacles = []
     while True:
-        obstacle_input = input("Obstacle (or 'done'): ").strip()
-        if obstacle_input.lower() == 'done':
-            break
-        try:
-            r, c = map(int, obstacle_input.split(','))
-            if 0 <= r < rows and 0 <= c < cols:
-                obstacles.append((r, c))
-                print(f"  ✓ Added obstacle at ({r}, {c})")
-            else:
-                print(f"  ✗ Position ({r}, {c}) is out of bounds!")
-        except:
-            print("  ✗ Invalid format! Use: row,col")
+        print("\n" + "=" * 80)
+        print("A* ALGORITHM - PATH FINDING RESEARCH ANALYSIS")
+        print("=" * 80)
+        print("Straight Move Cost: 1.0")
+        print(f"Diagonal Move Cost: {math.sqrt(2.0):.4f}")
+        print("Movement: 8-directional (up, down, left, right + diagonals)")
+        print("Heuristic: Octile-style distance")
+        print("=" * 80)
     
-    print(f"\n✓ Total obstacles: {len(obstacles)}")
+        # Get grid dimensions
+        print("\n📐 GRID SETUP")
+        print("-" * 80)
+        rows = int(input("Enter number of rows: "))
+        cols = int(input("Enter number of columns: "))
+        print(f"✓ Grid size: {rows} x {cols} ({rows * cols} total cells)")
     
-    # Get start and goal
-    print("\n🎯 START & GOAL POSITIONS")
-    print("-" * 80)
+        # Get obstacles
+        print("\n🚧 OBSTACLES SETUP")
+        print("-" * 80)
+        print("Enter obstacles as 'row,col' (one per line)")
+        print("Type 'done' when finished")
+        print("Example: 1,2")
     
-    while True:
-        start_input = input("Enter start position (row,col): ").strip()
-        try:
-            sr, sc = map(int, start_input.split(','))
-            if 0 <= sr < rows and 0 <= sc < cols:
-                if (sr, sc) not in obstacles:
-                    start = (sr, sc)
-                    print(f"  ✓ Start: ({sr}, {sc})")
-                    break
+        obstacles = []
+        while True:
+            obstacle_input = input("Obstacle (or 'done'): ").strip()
+            if obstacle_input.lower() == 'done':
+                break
+            try:
+                r, c = map(int, obstacle_input.split(','))
+                if 0 <= r < rows and 0 <= c < cols:
+                    obstacles.append((r, c))
+                    print(f"  ✓ Added obstacle at ({r}, {c})")
                 else:
-                    print("  ✗ Start position cannot be an obstacle!")
-            else:
-                print("  ✗ Position out of bounds!")
-        except:
-            print("  ✗ Invalid format! Use: row,col")
+                    print(f"  ✗ Position ({r}, {c}) is out of bounds!")
+            except:
+                print("  ✗ Invalid format! Use: row,col")
     
-    while True:
-        goal_input = input("Enter goal position (row,col): ").strip()
-        try:
-            gr, gc = map(int, goal_input.split(','))
-            if 0 <= gr < rows and 0 <= gc < cols:
-                if (gr, gc) not in obstacles:
-                    goal = (gr, gc)
-                    print(f"  ✓ Goal: ({gr}, {gc})")
-                    break
+        print(f"\n✓ Total obstacles: {len(obstacles)}")
+    
+        # Get start and goal
+        print("\n🎯 START & GOAL POSITIONS")
+        print("-" * 80)
+    
+        while True:
+            start_input = input("Enter start position (row,col): ").strip()
+            try:
+                sr, sc = map(int, start_input.split(','))
+                if 0 <= sr < rows and 0 <= sc < cols:
+                    if (sr, sc) not in obstacles:
+                        start = (sr, sc)
+                        print(f"  ✓ Start: ({sr}, {sc})")
+                        break
+                    else:
+                        print("  ✗ Start position cannot be an obstacle!")
                 else:
-                    print("  ✗ Goal position cannot be an obstacle!")
-            else:
-                print("  ✗ Position out of bounds!")
-        except:
-            print("  ✗ Invalid format! Use: row,col")
+                    print("  ✗ Position out of bounds!")
+            except:
+                print("  ✗ Invalid format! Use: row,col")
     
-    # Run A* algorithm
-    print("\n\n" + "=" * 80)
-    print("RUNNING A* ALGORITHM...")
-    print("=" * 80)
+        while True:
+            goal_input = input("Enter goal position (row,col): ").strip()
+            try:
+                gr, gc = map(int, goal_input.split(','))
+                if 0 <= gr < rows and 0 <= gc < cols:
+                    if (gr, gc) not in obstacles:
+                        goal = (gr, gc)
+                        print(f"  ✓ Goal: ({gr}, {gc})")
+                        break
+                    else:
+                        print("  ✗ Goal position cannot be an obstacle!")
+                else:
+                    print("  ✗ Position out of bounds!")
+            except:
+                print("  ✗ Invalid format! Use: row,col")
     
-    pathfinder = AStarPathfinder((rows, cols), obstacles)
-    result = pathfinder.astar(start, goal)
+        # Run A* algorithm
+        print("\n\n" + "=" * 80)
+        print("RUNNING A* ALGORITHM...")
+        print("=" * 80)
     
-    # Display results
-    print("\n" + "=" * 80)
-    print("RESEARCH PARAMETERS - A* ALGORITHM RESULTS")
-    print("=" * 80)
+        pathfinder = AStarPathfinder((rows, cols), obstacles)
+        result = pathfinder.astar(start, goal, record_trace=True)
     
-    if result['success']:
-        print("\n✓ PATH FOUND!")
-        print("-" * 80)
-        print(f"\na) Total Time Taken:           {result['execution_time_ms']:.6f} ms")
-        print(f"b) Nodes/Cells Explored:       {result['nodes_explored']} nodes (discovered)")
-        print(f"c) Nodes Expanded:             {result['nodes_expanded']} nodes (popped)")
-        print(f"d) Nodes in Final Path:        {result['path_length']} nodes")
-        print()
-        print(f"Path Cost:                     {result['total_cost']:.6f}")
-        print()
-
-        # Show explored nodes list in compact form.
-        if result['nodes_explored'] <= 30:
-            print("Explored nodes (discovered order):")
-            print(' → '.join([f'({x},{y})' for x, y in result['explored_nodes']]))
+        # Display results
+        print("\n" + "=" * 80)
+        print("RESEARCH PARAMETERS - A* ALGORITHM RESULTS")
+        print("=" * 80)
+    
+        if result['success']:
+            print("\n✓ PATH FOUND!")
+            print("-" * 80)
+            print(f"\na) Total Time Taken:           {result['execution_time_ms']:.6f} ms")
+            print(f"b) Nodes/Cells Explored:       {result['nodes_explored']} nodes (discovered)")
+            print(f"c) Nodes Expanded:             {result['nodes_expanded']} nodes (popped)")
+            print(f"d) Nodes in Final Path:        {result['path_length']} nodes")
             print()
-        else:
-            first_10 = ' → '.join([f'({x},{y})' for x, y in result['explored_nodes'][:10]])
-            last_10 = ' → '.join([f'({x},{y})' for x, y in result['explored_nodes'][-10:]])
-            print("Explored nodes (first 10 ... last 10):")
-            print(f"{first_10} ... {last_10}")
+            print(f"Path Cost:                     {result['total_cost']:.6f}")
             print()
+
+            # Show explored nodes list in compact form.
+            if result['nodes_explored'] <= 30:
+                print("Explored nodes (discovered order):")
+                print(' → '.join([f'({x},{y})' for x, y in result['explored_nodes']]))
+                print()
+            else:
+                first_10 = ' → '.join([f'({x},{y})' for x, y in result['explored_nodes'][:10]])
+                last_10 = ' → '.join([f'({x},{y})' for x, y in result['explored_nodes'][-10:]])
+                print("Explored nodes (first 10 ... last 10):")
+                print(f"{first_10} ... {last_10}")
+                print()
         
-        # Display path
-        if result['path_length'] <= 20:
-            print(f"Complete Path:")
-            print(f"{' → '.join([f'({x},{y})' for x, y in result['path']])}")
-        else:
-            print(f"Path (first 5 and last 5 nodes):")
-            first_5 = ' → '.join([f'({x},{y})' for x, y in result['path'][:5]])
-            last_5 = ' → '.join([f'({x},{y})' for x, y in result['path'][-5:]])
-            print(f"{first_5} ... {last_5}")
+            # Display path
+            if result['path_length'] <= 20:
+                print(f"Complete Path:")
+                print(f"{' → '.join([f'({x},{y})' for x, y in result['path']])}")
+            else:
+                print(f"Path (first 5 and last 5 nodes):")
+                first_5 = ' → '.join([f'({x},{y})' for x, y in result['path'][:5]])
+                last_5 = ' → '.join([f'({x},{y})' for x, y in result['path'][-5:]])
+                print(f"{first_5} ... {last_5}")
         
-    else:
-        print("\n✗ NO PATH FOUND!")
-        print("-" * 80)
-        print(f"\na) Total Time Taken:           {result['execution_time_ms']:.6f} ms")
-        print(f"b) Nodes/Cells Explored:       {result['nodes_explored']} nodes (discovered)")
-        print(f"c) Nodes Expanded:             {result['nodes_expanded']} nodes (popped)")
-        print(f"d) Nodes in Final Path:        0 nodes (no path exists)")
-        print("\nReason: The goal is unreachable from the start position.")
-    
-    print("\n" + "=" * 80)
-    print("ANALYSIS COMPLETE")
-    print("=" * 80)
-    
-    # Visualize the pathfinding
-    print("\n📊 Generating visualization...")
-    visualize_pathfinding(rows, cols, obstacles, start, goal, result)
-    
-    # Ask if user wants to test another scenario
-    print("\nWould you like to test another scenario? (y/n): ", end="")
-    if input().strip().lower() == 'y':
-        run_astar_analysis()
+        else:
+            print("\n✗ NO PATH FOUND!")
+            print("-" * 80)
+            print(f"\na) Total Time Taken:           {result['execution_time_ms']:.6f} ms")
+            print(f"b) Nodes/Cells Explored:       {result['nodes_explored']} nodes (discovered)")
+            print(f"c) Nodes Expanded:             {result['nodes_expanded']} nodes (popped)")
+            print(f"d) Nodes in Final Path:        0 nodes (no path exists)")
+            print("\nReason: The goal is unreachable from the start position.")
+    
+        print("\n" + "=" * 80)
+        print("ANALYSIS COMPLETE")
+        print("=" * 80)
+    
+        # Visualize the pathfinding
+        print("\n📊 Generating visualization...")
+        visualize_pathfinding(rows, cols, obstacles, start, goal, result)
+    
+        # Ask if user wants to test another scenario
+        print("\nWould you like to test another scenario? (y/n): ", end="")
+        if input().strip().lower() != 'y':
+            break
 
 
 if __name__ == "__main__":
@@ -1,56 +1,174 @@
 import time
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.colors import ListedColormap
+import heapq
+import multiprocessing
+from collections import deque
+from itertools import chain
 import numpy as np
 
-class Node:
-    """Simple linked list node for queue implementation"""
-    def __init__(self, data, cost):
-        self.data = data
-        self.cost = cost
-        self.next = None
-
-class SimpleQueue:
-    """Basic linked list queue for Dijkstra's algorithm"""
-    def __init__(self):
-        self.head = None
-        self.size = 0
-    
-    def is_empty(self):
-        return self.head is None
-    
-    def insert(self, data, cost):
-        """Insert node in sorted order by cost"""
-        new_node = Node(data, cost)
-        self.size += 1
-        
-        if self.head is None or cost < self.head.cost:
-            new_node.next = self.head
-            self.head = new_node
-            return
-        
-        current = self.head
-        while current.next and current.next.cost <= cost:
-            current = current.next
-        new_node.next = current.next
-        current.next = new_node
-    
-    def pop(self):
-        """Remove and return minimum cost node"""
-        if self.head is None:
-            return None, None
-        data = self.head.data
-        cost = self.head.cost
-        self.head = self.head.next
-        self.size -= 1
-        return data, cost
+try:
+    from _astar_cy import CDijkstra
+except ImportError:
+    try:  # Imported as part of the Graphs_Algo package
+        from ._astar_cy import CDijkstra
+    except ImportError:  # C extension is optional; build with cythonize -i _astar_cy.pyx
+        CDijkstra = None
+
+try:
+    import cupy as cp
+except ImportError:  # CuPy is optional; batch_bfs_gpu falls back to NumPy
+    cp = None
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; dijkstra() falls back to pure Python
+    njit = None
+
+
+def _jit(fn):
+    """Compile fn with Numba when it is installed, otherwise return it as-is."""
+    return njit(cache=True)(fn) if njit is not None else fn
+
+
+# A plain binary heap: the open list only ever holds the search frontier,
+# which stays small and cache-resident, and the 4-ary heap in _dary_heap
+# measured slower for this kernel.
+@_jit
+def _heap_push(heap_cost, heap_c, heap_idx, size, cost, c, idx):
+    """Push (cost, c, idx) onto the array-backed binary min-heap; return new size."""
+    i = size
+    while i > 0:
+        p = (i - 1) >> 1
+        if heap_cost[p] < cost or (heap_cost[p] == cost and heap_c[p] < c):
+            break
+        heap_cost[i] = heap_cost[p]
+        heap_c[i] = heap_c[p]
+        heap_idx[i] = heap_idx[p]
+        i = p
+    heap_cost[i] = cost
+    heap_c[i] = c
+    heap_idx[i] = idx
+    return size + 1
+
+
+@_jit
+def _heap_pop(heap_cost, heap_c, heap_idx, size):
+    """Pop the minimum (cost, c) entry; return (idx, cost, new size)."""
+    top = heap_idx[0]
+    top_cost = heap_cost[0]
+    size -= 1
+    cost = heap_cost[size]
+    c = heap_c[size]
+    idx = heap_idx[size]
+    i = 0
+    while True:
+        child = 2 * i + 1
+        if child >= size:
+            break
+        right = child + 1
+        if right < size and (heap_cost[right] < heap_cost[child] or
+                             (heap_cost[right] == heap_cost[child] and heap_c[right] < heap_c[child])):
+            child = right
+        if cost < heap_cost[child] or (cost == heap_cost[child] and c < heap_c[child]):
+            break
+        heap_cost[i] = heap_cost[child]
+        heap_c[i] = heap_c[child]
+        heap_idx[i] = heap_idx[child]
+        i = child
+    heap_cost[i] = cost
+    heap_c[i] = c
+    heap_idx[i] = idx
+    return top, top_cost, size
+
+
+@_jit
+def _dijkstra_core(obstacle, sx, sy, gx, gy, unit_cost):
+    """
+    Dijkstra search over a bool obstacle grid with cells encoded as x*cols+y.
+    Mirrors DijkstraPathfinder.dijkstra: same neighbor order, and the
+    (cost, insertion counter) heap key pops equal costs first-in first-out
+    like the heapq queue in dijkstra().
+    Returns (parent, explored_order, n_explored, found).
+    """
+    rows, cols = obstacle.shape
+    size = rows * cols
+
+    distances = np.full(size, np.inf)
+    parent = np.full(size, -1, np.int32)
+    order = np.empty(size, np.int32)
+
+    # Every move costs the same, so a cell's first tentative distance is
+    # final and each cell is pushed at most once: no stale entries to skip
+    # on pop, and distances doubles as the settled test
+    heap_cost = np.empty(size, np.float64)
+    heap_c = np.empty(size, np.int64)
+    heap_idx = np.empty(size, np.int32)
+
+    start = sx * cols + sy
+    goal = gx * cols + gy
+    distances[start] = 0.0
+    heap_size = _heap_push(heap_cost, heap_c, heap_idx, 0, 0.0, 0, start)
+    counter = 1
+    n_explored = 0
+
+    while heap_size > 0:
+        cur, cur_cost, heap_size = _heap_pop(heap_cost, heap_c, heap_idx, heap_size)
+        order[n_explored] = cur
+        n_explored += 1
+        if cur == goal:
+            return parent, order, n_explored, True
+
+        x = cur // cols
+        y = cur - x * cols
+        new_cost = cur_cost + unit_cost
+        # Right, Down, Left, Up
+        for k in range(4):
+            if k == 0:
+                nx, ny = x, y + 1
+            elif k == 1:
+                nx, ny = x + 1, y
+            elif k == 2:
+                nx, ny = x, y - 1
+            else:
+                nx, ny = x - 1, y
+            if nx < 0 or nx >= rows or ny < 0 or ny >= cols or obstacle[nx, ny]:
+                continue
+            nb = nx * cols + ny
+            if new_cost >= distances[nb]:
+                continue
+            distances[nb] = new_cost
+            parent[nb] = cur
+            heap_size = _heap_push(heap_cost, heap_c, heap_idx, heap_size, new_cost, counter, nb)
+            counter += 1
+        # Goal reached on push: with one move cost its first tentative
+        # distance is final, so the pops still queued ahead of it are skipped
+        if distances[goal] < np.inf:
+            order[n_explored] = goal
+            n_explored += 1
+            return parent, order, n_explored, True
+
+    return parent, order, n_explored, False
+
+
+# 4-directional moves as (d_row, d_col): Right, Down, Left, Up
+_DIRS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+
+# dijkstra_jps gives up and hands the query to dijkstra once it has
+# expanded this fraction of the grid's cells. Scattered obstacles put a
+# jump point on almost every cell, and then the scans only add overhead;
+# on open or wall-structured grids it needs a few hundred expansions
+JPS_EXPANSION_BUDGET = 1 / 64
+
+# Largest integer move cost dijkstra() hands to Dial's bucket queue; the
+# bucket ring has DIAL_MAX_COST + 1 slots and is walked one cost at a time
+DIAL_MAX_COST = 256
+
 
 class DijkstraPathfinder:
     """
     Optimized Dijkstra's Algorithm Implementation
     Unit cost: 1 for all paths
-    Uses only arrays and linked lists
+    Uses only arrays, a binary heap, FIFO buckets (Dial's algorithm for
+    small integer costs) and a FIFO deque (for the unit-cost BFS)
     """
     
     def __init__(self, grid, obstacles):
@@ -60,11 +178,36 @@ class DijkstraPathfinder:
         obstacles: list of (row, col) tuples representing blocked cells
         """
         self.rows, self.cols = grid
-        # Use 2D array for obstacles instead of set/dict
-        self.obstacle_grid = [[False] * self.cols for _ in range(self.rows)]
-        for r, c in obstacles:
-            self.obstacle_grid[r][c] = True
+        # Boolean obstacle grid, filled with a single fancy-indexed write
+        self.obstacle_np = np.zeros((self.rows, self.cols), dtype=np.bool_)
+        if len(obstacles):
+            if isinstance(obstacles, np.ndarray):
+                obs = obstacles.astype(np.intp, copy=False)
+            else:
+                # Streaming the flattened pairs through fromiter is several
+                # times cheaper than asarray on a list of tuples
+                obs = np.fromiter(chain.from_iterable(obstacles), dtype=np.intp,
+                                  count=2 * len(obstacles)).reshape(-1, 2)
+            self.obstacle_np[obs[:, 0], obs[:, 1]] = True
+        # Kept under its old name; the searches read the flat bytearray
+        # below or hand obstacle_np to a compiled kernel, so no per-cell
+        # Python copy of the grid is built
+        self.obstacle_grid = self.obstacle_np
+        # Same grid wrapped in a one-cell blocked border, so a single lookup
+        # covers both the bounds check and the obstacle check
+        padded = np.pad(self.obstacle_np, 1, constant_values=True)
+        # Flat bytearray of the padded grid (one byte per cell, copied
+        # straight from the NumPy buffer) plus the 4 moves (Right, Down,
+        # Left, Up) as (offset in the grid, offset in the padded grid),
+        # built once and shared by every search on this grid
+        self._blocked_flat = bytearray(padded.tobytes())
+        self._flat_offsets = ((1, 1), (self.cols, self.cols + 2),
+                              (-1, -1), (-self.cols, -(self.cols + 2)))
         self.UNIT_COST = 1  # Fixed unit cost for all movements
+        # Compiled C BFS / Dijkstra, when the Cython extension has been built
+        self._c = CDijkstra(self.obstacle_np) if CDijkstra is not None else None
+        # Bit-packed rows for dijkstra_jps, built on its first call
+        self._row_scan = None
         
     
     def get_neighbors(self, node):
@@ -74,132 +217,883 @@ class DijkstraPathfinder:
         """
         x, y = node
         neighbors = []
-        # 4-directional movement: Right, Down, Left, Up
-        directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+        # Padded grid is offset by one: cell (nx, ny) lives at
+        # (nx + 1) * (cols + 2) + (ny + 1)
+        blocked = self._blocked_flat
+        width = self.cols + 2
         
-        for dx, dy in directions:
+        for dx, dy in _DIRS:
             nx, ny = x + dx, y + dy
-            # Check if neighbor is within grid bounds and not an obstacle
-            if (0 <= nx < self.rows and 0 <= ny < self.cols and 
-                not self.obstacle_grid[nx][ny]):
+            # Out-of-bounds cells fall on the blocked border
+            if not blocked[(nx + 1) * width + ny + 1]:
                 neighbors.append((nx, ny))
         
         return neighbors
     
-    def dijkstra(self, start, goal):
+    def dijkstra(self, start, goal, astar=False, record_trace=False):
         """
-        Optimized Dijkstra's algorithm using only arrays and linked list
-        Time Complexity: O(V^2) where V is number of vertices
+        Optimized Dijkstra's algorithm using only arrays and a binary heap
+        Cells are carried as flat indices idx = row * cols + col in the
+        hot loop and converted back to (row, col) tuples only on output.
+        Dispatches to dijkstra_bfs when every move costs UNIT_COST == 1,
+        and to dijkstra_dial for other small integer costs
+        astar=True runs the goal-directed dijkstra_astar instead
+        record_trace: fill 'explored_nodes' with the visit order (for
+        visualization); otherwise it is left empty and only the count
+        is reported.
+        Time Complexity: O(V log V) where V is number of vertices
         Space Complexity: O(V)
         Returns: dictionary with path, metrics
         """
-        start_time = time.time()
+        if astar:
+            return self.dijkstra_astar(start, goal, record_trace)
+        # On a unit-cost grid BFS settles nodes in the same distance order
+        # without any priority queue work
+        if self.UNIT_COST == 1:
+            return self.dijkstra_bfs(start, goal, record_trace)
+        if self._c is not None or njit is not None:
+            return self._dijkstra_compiled(start, goal, record_trace)
+        if isinstance(self.UNIT_COST, int) and 0 < self.UNIT_COST <= DIAL_MAX_COST:
+            return self.dijkstra_dial(start, goal, record_trace)
         
-        # Use linked list based priority queue
-        queue = SimpleQueue()
-        queue.insert(start, 0)
+        start_time = time.perf_counter_ns()
         
-        # Use 2D arrays instead of dictionaries for O(1) access
+        rows, cols = self.rows, self.cols
+        size = rows * cols
+        start_idx = start[0] * cols + start[1]
+        goal_idx = goal[0] * cols + goal[1]
+        blocked = self._blocked_flat
+        width = cols + 2
+        unit_cost = self.UNIT_COST
+        
+        # Binary heap of (cost, counter, cell); the counter pops equal
+        # costs in insertion order and keeps the cell out of comparisons.
+        # Every move costs UNIT_COST, so a cell's first tentative distance
+        # is already final: each cell is pushed once and no stale entries
+        # ever need skipping
+        queue = [(0, 0, start_idx)]
+        counter = 1
+        # Bound functions hoisted out of the loop (one local load per call
+        # instead of an attribute lookup)
+        heappush, heappop = heapq.heappush, heapq.heappop
+        
+        # Use flat arrays instead of dictionaries for O(1) access
         INF = float('inf')
         # Distance from start to each node
-        distances = [[INF] * self.cols for _ in range(self.rows)]
-        distances[start[0]][start[1]] = 0
+        distances = [INF] * size
+        distances[start_idx] = 0
         
-        # To reconstruct the path
-        parent = [[None] * self.cols for _ in range(self.rows)]
+        # To reconstruct the path (-1 = no parent)
+        parent = [-1] * size
         
-        # Track explored nodes
-        explored = [[False] * self.cols for _ in range(self.rows)]
         nodes_explored = 0
-        explored_list = []  # Store order of exploration for visualization
+        explored_order = []  # Store order of exploration for visualization
+        record = explored_order.append
         
-        while not queue.is_empty():
-            current_node, current_cost = queue.pop()
-            x, y = current_node
+        while queue:
+            current_cost, _, current = heappop(queue)
+            nodes_explored += 1
+            if record_trace:
+                record(current)  # Track exploration order
             
-            # Skip if already explored
-            if explored[x][y]:
-                continue
+            # Goal found - early exit
+            if current == goal_idx:
+                end_time = time.perf_counter_ns()
+                path = self._reconstruct_path(parent, start_idx, goal_idx,
+                                              round(distances[goal_idx] / unit_cost) + 1)
+                return self._make_result(path, nodes_explored, end_time - start_time,
+                                         True, explored_order)
+            
+            # Explore neighbors: Right, Down, Left, Up, unrolled
+            # (out-of-bounds cells fall on the padded grid's blocked border).
+            # Settled cells already hold a distance <= new_cost, so the
+            # distance test alone also keeps them out of the queue
+            padded_current = current + 2 * (current // cols) + cols + 3
+            new_cost = current_cost + unit_cost
+            neighbor = current + 1
+            if not blocked[padded_current + 1] and new_cost < distances[neighbor]:
+                distances[neighbor] = new_cost
+                parent[neighbor] = current
+                heappush(queue, (new_cost, counter, neighbor))
+                counter += 1
+            neighbor = current + cols
+            if not blocked[padded_current + width] and new_cost < distances[neighbor]:
+                distances[neighbor] = new_cost
+                parent[neighbor] = current
+                heappush(queue, (new_cost, counter, neighbor))
+                counter += 1
+            neighbor = current - 1
+            if not blocked[padded_current - 1] and new_cost < distances[neighbor]:
+                distances[neighbor] = new_cost
+                parent[neighbor] = current
+                heappush(queue, (new_cost, counter, neighbor))
+                counter += 1
+            neighbor = current - cols
+            if not blocked[padded_current - width] and new_cost < distances[neighbor]:
+                distances[neighbor] = new_cost
+                parent[neighbor] = current
+                heappush(queue, (new_cost, counter, neighbor))
+                counter += 1
             
-            explored[x][y] = True
+            # Goal found on push - early exit. Its first tentative distance
+            # is already final, so there is no need to wait for its pop
+            if distances[goal_idx] != INF:
+                nodes_explored += 1
+                if record_trace:
+                    record(goal_idx)
+                end_time = time.perf_counter_ns()
+                path = self._reconstruct_path(parent, start_idx, goal_idx,
+                                              round(new_cost / unit_cost) + 1)
+                return self._make_result(path, nodes_explored, end_time - start_time,
+                                         True, explored_order)
+        
+        # No path found
+        end_time = time.perf_counter_ns()
+        return self._make_result([], nodes_explored, end_time - start_time, False, explored_order)
+    
+    def dijkstra_astar(self, start, goal, record_trace=False):
+        """
+        A* on the same 4-connected grid: Dijkstra ordered by g + h, where
+        h = UNIT_COST * (|row - goal_row| + |col - goal_col|) is the
+        Manhattan distance. It is consistent for 4-directional moves, so
+        the path stays optimal while the search is pulled toward the goal
+        instead of growing a full disc around the start. Ties on g + h
+        go to the larger g, i.e. the cell closer to the goal
+        Time Complexity: O(V log V) where V is number of vertices
+        Space Complexity: O(V)
+        Returns: dictionary with path, metrics (same keys as dijkstra)
+        """
+        start_time = time.perf_counter_ns()
+        
+        rows, cols = self.rows, self.cols
+        size = rows * cols
+        start_idx = start[0] * cols + start[1]
+        goal_idx = goal[0] * cols + goal[1]
+        goal_row, goal_col = goal
+        blocked = self._blocked_flat
+        width = cols + 2
+        unit_cost = self.UNIT_COST
+        # (offset, padded offset, d_row, d_col): Right, Down, Left, Up
+        moves = ((1, 1, 0, 1), (cols, width, 1, 0),
+                 (-1, -1, 0, -1), (-cols, -width, -1, 0))
+        
+        INF = float('inf')
+        distances = [INF] * size  # g: cost from start
+        distances[start_idx] = 0
+        parent = [-1] * size
+        closed = bytearray(size)  # 1 = settled
+        nodes_explored = 0
+        explored_order = []  # Store order of exploration for visualization
+        record = explored_order.append
+        heappush, heappop = heapq.heappush, heapq.heappop
+        found = False
+        
+        h_start = unit_cost * (abs(start[0] - goal_row) + abs(start[1] - goal_col))
+        # Entries are (g + h, -g, cell); a cell whose g improves while
+        # queued is pushed again and the stale entry skipped on pop
+        open_heap = [(h_start, 0, start_idx)]
+        
+        while open_heap:
+            _, neg_g, current = heappop(open_heap)
+            if closed[current]:
+                continue
+            closed[current] = 1
             nodes_explored += 1
-            explored_list.append((x, y))  # Track exploration order
+            if record_trace:
+                record(current)
             
             # Goal found - early exit
-            if current_node == goal:
-                end_time = time.time()
-                path = self._reconstruct_path(parent, start, goal)
+            if current == goal_idx:
+                found = True
+                break
+            
+            # (out-of-bounds cells fall on the padded grid's blocked border)
+            row, col = divmod(current, cols)
+            padded_current = current + 2 * row + cols + 3
+            new_cost = unit_cost - neg_g
+            for offset, padded_offset, d_row, d_col in moves:
+                neighbor = current + offset
+                if not blocked[padded_current + padded_offset] and new_cost < distances[neighbor]:
+                    distances[neighbor] = new_cost
+                    parent[neighbor] = current
+                    h = unit_cost * (abs(row + d_row - goal_row) + abs(col + d_col - goal_col))
+                    heappush(open_heap, (new_cost + h, -new_cost, neighbor))
+        
+        end_time = time.perf_counter_ns()
+        path = []
+        if found:
+            path = self._reconstruct_path(parent, start_idx, goal_idx,
+                                          round(distances[goal_idx] / unit_cost) + 1)
+        return self._make_result(path, nodes_explored, end_time - start_time, found, explored_order)
+    
+    def dijkstra_dial(self, start, goal, record_trace=False):
+        """
+        Dial's algorithm: Dijkstra for small positive integer move costs
+        The sorted queue is replaced by a ring of UNIT_COST + 1 FIFO
+        buckets, bucket d % (UNIT_COST + 1) holding the cells at tentative
+        distance d. No move costs more than UNIT_COST, so a bucket never
+        mixes two distances, and insert / pop are O(1) list operations.
+        Explores cells in the same order as the linked-list queue
+        Time Complexity: O(V + D) where D is the distance to the goal
+        Space Complexity: O(V)
+        Returns: dictionary with path, metrics
+        """
+        start_time = time.perf_counter_ns()
+        
+        rows, cols = self.rows, self.cols
+        size = rows * cols
+        start_idx = start[0] * cols + start[1]
+        goal_idx = goal[0] * cols + goal[1]
+        blocked = self._blocked_flat
+        width = cols + 2
+        unit_cost = self.UNIT_COST
+        
+        n_buckets = unit_cost + 1
+        buckets = [[] for _ in range(n_buckets)]
+        buckets[0].append(start_idx)
+        pending = 1  # Cells queued across all buckets
+        
+        INF = float('inf')
+        distances = [INF] * size
+        distances[start_idx] = 0
+        parent = [-1] * size
+        nodes_explored = 0
+        explored_order = []  # Store order of exploration for visualization
+        record = explored_order.append
+        found = False
+        
+        cost = 0
+        while pending and not found:
+            slot = cost % n_buckets
+            bucket = buckets[slot]
+            if not bucket:
+                cost += 1
+                continue
+            buckets[slot] = []
+            pending -= len(bucket)
+            # Every cell queued here is reached at cost + unit_cost, which
+            # is always a different slot from the one being drained
+            new_cost = cost + unit_cost
+            next_bucket = buckets[new_cost % n_buckets]
+            queued_before = len(next_bucket)
+            push = next_bucket.append
+            
+            for current in bucket:
+                nodes_explored += 1
+                if record_trace:
+                    record(current)
+                
+                # Goal found - early exit
+                if current == goal_idx:
+                    found = True
+                    break
+                
+                # Explore neighbors: Right, Down, Left, Up, unrolled
+                # (out-of-bounds cells fall on the padded grid's blocked border)
+                padded_current = current + 2 * (current // cols) + cols + 3
+                neighbor = current + 1
+                if not blocked[padded_current + 1] and new_cost < distances[neighbor]:
+                    distances[neighbor] = new_cost
+                    parent[neighbor] = current
+                    push(neighbor)
+                neighbor = current + cols
+                if not blocked[padded_current + width] and new_cost < distances[neighbor]:
+                    distances[neighbor] = new_cost
+                    parent[neighbor] = current
+                    push(neighbor)
+                neighbor = current - 1
+                if not blocked[padded_current - 1] and new_cost < distances[neighbor]:
+                    distances[neighbor] = new_cost
+                    parent[neighbor] = current
+                    push(neighbor)
+                neighbor = current - cols
+                if not blocked[padded_current - width] and new_cost < distances[neighbor]:
+                    distances[neighbor] = new_cost
+                    parent[neighbor] = current
+                    push(neighbor)
                 
-                return {
-                    'path': path,
-                    'nodes_explored': nodes_explored,
-                    'execution_time_ms': (end_time - start_time) * 1000,
-                    'path_length': len(path),
-                    'success': True,
-                    'explored_nodes': explored_list
-                }
+                # Goal found on push - early exit (its distance is final)
+                if distances[goal_idx] != INF:
+                    nodes_explored += 1
+                    if record_trace:
+                        record(goal_idx)
+                    found = True
+                    break
             
-            # Explore neighbors
-            for neighbor in self.get_neighbors(current_node):
-                nx, ny = neighbor
-                if not explored[nx][ny]:
-                    new_cost = current_cost + self.UNIT_COST
-                    
-                    # Only update if we found a better path
-                    if new_cost < distances[nx][ny]:
-                        distances[nx][ny] = new_cost
-                        parent[nx][ny] = current_node
-                        queue.insert(neighbor, new_cost)
+            pending += len(next_bucket) - queued_before
+            cost += 1
         
-        # No path found
-        end_time = time.time()
+        end_time = time.perf_counter_ns()
+        path = []
+        if found:
+            path = self._reconstruct_path(parent, start_idx, goal_idx,
+                                          round(distances[goal_idx] / unit_cost) + 1)
+        return self._make_result(path, nodes_explored, end_time - start_time, found, explored_order)
+    
+    def dijkstra_bfs(self, start, goal, record_trace=False):
+        """
+        Breadth-first search with a FIFO deque for unit-cost grids
+        Equivalent to Dijkstra when all moves cost 1; each cell is
+        enqueued at most once (marked visited on enqueue)
+        Time Complexity: O(V) where V is number of vertices
+        Space Complexity: O(V)
+        Returns: dictionary with path, metrics
+        """
+        if self._c is not None:
+            return self._bfs_compiled(start, goal, record_trace)
+        
+        start_time = time.perf_counter_ns()
+        
+        rows, cols = self.rows, self.cols
+        size = rows * cols
+        start_idx = start[0] * cols + start[1]
+        goal_idx = goal[0] * cols + goal[1]
+        width = cols + 2
+        
+        # Copy of the padded blocked grid that also marks visited cells,
+        # so one lookup covers bounds, obstacle and visited checks
+        closed = bytearray(self._blocked_flat)
+        closed[start_idx + 2 * start[0] + cols + 3] = 1
+        queue = deque([start_idx])
+        parent = [-1] * size
+        nodes_explored = 0
+        explored_order = []  # Store order of exploration for visualization
+        # Bound methods hoisted out of the loop
+        popleft, push, record = queue.popleft, queue.append, explored_order.append
+        found = False
+        
+        while queue:
+            current = popleft()
+            nodes_explored += 1
+            if record_trace:
+                record(current)
+            
+            # Only reached for start == goal; otherwise the goal is caught
+            # when it is enqueued below
+            if current == goal_idx:
+                found = True
+                break
+            
+            # Explore neighbors: Right, Down, Left, Up, unrolled
+            # (out-of-bounds cells fall on the padded grid's blocked border)
+            padded_current = current + 2 * (current // cols) + cols + 3
+            if not closed[padded_current + 1]:
+                closed[padded_current + 1] = 1
+                neighbor = current + 1
+                parent[neighbor] = current
+                push(neighbor)
+            if not closed[padded_current + width]:
+                closed[padded_current + width] = 1
+                neighbor = current + cols
+                parent[neighbor] = current
+                push(neighbor)
+            if not closed[padded_current - 1]:
+                closed[padded_current - 1] = 1
+                neighbor = current - 1
+                parent[neighbor] = current
+                push(neighbor)
+            if not closed[padded_current - width]:
+                closed[padded_current - width] = 1
+                neighbor = current - cols
+                parent[neighbor] = current
+                push(neighbor)
+            
+            # Goal found on enqueue - early exit. A cell's BFS distance is
+            # final the moment it is first reached, so the cells queued
+            # ahead of the goal need not be expanded
+            if parent[goal_idx] != -1:
+                nodes_explored += 1
+                if record_trace:
+                    record(goal_idx)
+                found = True
+                break
+        
+        end_time = time.perf_counter_ns()
+        path = self._reconstruct_path(parent, start_idx, goal_idx) if found else []
+        return self._make_result(path, nodes_explored, end_time - start_time, found, explored_order)
+    
+    def _dijkstra_compiled(self, start, goal, record_trace=False):
+        """
+        Thin wrapper around CDijkstra.dijkstra_c / _dijkstra_core: converts
+        flat cell indices back to (row, col) tuples and builds the result
+        dictionary.
+        """
+        start_time = time.perf_counter_ns()
+        cols = self.cols
+        if self._c is not None:
+            parent, order, n_explored, found = self._c.dijkstra_c(
+                start[0], start[1], goal[0], goal[1], float(self.UNIT_COST))
+        else:
+            parent, order, n_explored, found = _dijkstra_core(
+                self.obstacle_np, start[0], start[1], goal[0], goal[1], float(self.UNIT_COST))
+        path = []
+        if found:
+            path = self._reconstruct_path(parent, start[0] * cols + start[1],
+                                          goal[0] * cols + goal[1])
+        end_time = time.perf_counter_ns()
+        
+        return self._make_result(path, int(n_explored), end_time - start_time, bool(found),
+                                 order[:n_explored].tolist() if record_trace else [])
+    
+    def _bfs_compiled(self, start, goal, record_trace=False):
+        """
+        Thin wrapper around CDijkstra.bfs_c: converts flat cell indices
+        back to (row, col) tuples and builds the result dictionary.
+        """
+        start_time = time.perf_counter_ns()
+        cols = self.cols
+        parent, order, n_explored, found = self._c.bfs_c(start[0], start[1], goal[0], goal[1])
+        path = []
+        if found:
+            path = self._reconstruct_path(parent, start[0] * cols + start[1],
+                                          goal[0] * cols + goal[1])
+        end_time = time.perf_counter_ns()
+        
+        return self._make_result(path, n_explored, end_time - start_time, found,
+                                 order[:n_explored].tolist() if record_trace else [])
+    
+    def bidir_dijkstra(self, start, goal, record_trace=False):
+        """
+        Bidirectional search for point-to-point queries
+        One frontier grows from start and one from goal, a full level at
+        a time, always expanding the smaller frontier. On a unit-cost grid
+        this is bidirectional Dijkstra: the first touch between the two
+        searches is already a cheapest meeting cell, so the search stops
+        there without finishing the level
+        Time Complexity: O(V) where V is number of vertices
+        Space Complexity: O(V)
+        Returns: dictionary with path, metrics (same keys as dijkstra)
+        """
+        start_time = time.perf_counter_ns()
+        
+        rows, cols = self.rows, self.cols
+        size = rows * cols
+        start_idx = start[0] * cols + start[1]
+        goal_idx = goal[0] * cols + goal[1]
+        blocked = self._blocked_flat
+        offsets = self._flat_offsets
+        
+        # Index 0 = forward search (from start), 1 = backward search (from goal)
+        # Distances in moves; -1 = not reached by that search
+        dist = ([-1] * size, [-1] * size)
+        parents = ([-1] * size, [-1] * size)
+        dist[0][start_idx] = 0
+        dist[1][goal_idx] = 0
+        frontiers = [[start_idx], [goal_idx]]
+        nodes_explored = 0
+        explored_order = []  # Store order of exploration for visualization
+        record = explored_order.append
+        
+        meet = start_idx if start_idx == goal_idx else -1
+        while meet == -1 and frontiers[0] and frontiers[1]:
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            dist_side, dist_other = dist[side], dist[1 - side]
+            parent_side = parents[side]
+            next_frontier = []
+            push = next_frontier.append
+            
+            for current in frontiers[side]:
+                nodes_explored += 1
+                if record_trace:
+                    record(current)
+                new_dist = dist_side[current] + 1
+                
+                # Explore neighbors: Right, Down, Left, Up
+                padded_current = current + 2 * (current // cols) + cols + 3
+                for offset, padded_offset in offsets:
+                    neighbor = current + offset
+                    if not blocked[padded_current + padded_offset] and dist_side[neighbor] == -1:
+                        dist_side[neighbor] = new_dist
+                        parent_side[neighbor] = current
+                        push(neighbor)
+                        
+                        # The two searches touch at this neighbor. Every
+                        # touch on this level is with the other search's
+                        # outermost level (a shallower cell was expanded
+                        # already and would have touched us earlier), so
+                        # they all give the same total and the rest of
+                        # the level cannot improve on this one
+                        if dist_other[neighbor] != -1:
+                            meet = neighbor
+                            break
+                if meet != -1:
+                    break
+            
+            frontiers[side] = next_frontier
+        
+        end_time = time.perf_counter_ns()
+        if meet == -1:
+            return self._make_result([], nodes_explored, end_time - start_time, False, explored_order)
+        
+        # start -> meet from the forward tree, meet -> goal from the backward tree
+        path = self._reconstruct_path(parents[0], start_idx, meet, dist[0][meet] + 1)
+        current = parents[1][meet]
+        while current != -1:
+            path.append(divmod(current, cols))
+            current = parents[1][current]
+        
+        return self._make_result(path, nodes_explored, end_time - start_time, True, explored_order)
+    
+    def dijkstra_jps(self, start, goal, record_trace=False):
+        """
+        Jump Point Search for the uniform-cost 4-connected grid
+        Straight runs are scanned without touching the heap; only jump
+        points (the goal, cells where a side opens up past an obstacle,
+        and vertical-run cells from which a horizontal run reaches one)
+        are pushed, collapsing the many equal-cost symmetric paths.
+        Horizontal runs test whole bit-packed rows at once
+        Falls back to dijkstra after JPS_EXPANSION_BUDGET of the grid's
+        cells have been expanded (cluttered grids)
+        Returns: dictionary with path, metrics (same keys as dijkstra);
+        explored_nodes lists the expanded jump points
+        """
+        start_time = time.perf_counter_ns()
+        
+        rows, cols = self.rows, self.cols
+        size = rows * cols
+        start_idx = start[0] * cols + start[1]
+        goal_idx = goal[0] * cols + goal[1]
+        unit_cost = self.UNIT_COST
+        if self._row_scan is None:
+            self._row_scan = self._pack_rows()
+        
+        INF = float('inf')
+        distances = [INF] * size
+        distances[start_idx] = 0
+        parent = [-1] * size
+        closed = bytearray(size)  # 1 = settled
+        nodes_explored = 0
+        explored_order = []  # Store order of exploration for visualization
+        record = explored_order.append
+        heappush, heappop = heapq.heappush, heapq.heappop
+        jump_row, jump_col = self._jump_row, self._jump_col
+        found = False
+        
+        open_heap = [(0, 0, start_idx)]
+        counter = 1
+        budget = max(1, int(size * JPS_EXPANSION_BUDGET))
+        
+        while open_heap:
+            current_cost, _, current = heappop(open_heap)
+            if closed[current]:
+                continue
+            if nodes_explored == budget:
+                # Too many jump points: plain expansion is cheaper. The
+                # reported time includes the abandoned JPS attempt
+                result = self.dijkstra(start, goal, record_trace=record_trace)
+                result['execution_time_ms'] = (time.perf_counter_ns() - start_time) / 1e6
+                return result
+            closed[current] = 1
+            nodes_explored += 1
+            if record_trace:
+                record(current)
+            
+            # Goal found - early exit
+            if current == goal_idx:
+                found = True
+                break
+            
+            # Scan forward and to both sides of the direction we arrived
+            # from; all 4 directions from the start
+            x, y = divmod(current, cols)
+            if parent[current] < 0:
+                directions = _DIRS
+            else:
+                px, py = divmod(parent[current], cols)
+                if px == x:
+                    directions = ((0, 1 if y > py else -1), (1, 0), (-1, 0))
+                else:
+                    directions = ((1 if x > px else -1, 0), (0, 1), (0, -1))
+            
+            for dx, dy in directions:
+                if dx:
+                    jx = jump_col(x, y, dx, goal)
+                    if jx < 0:
+                        continue
+                    jump, steps = jx * cols + y, abs(jx - x)
+                else:
+                    jy = jump_row(x, y, dy, goal)
+                    if jy < 0:
+                        continue
+                    jump, steps = x * cols + jy, abs(jy - y)
+                new_cost = current_cost + steps * unit_cost
+                if new_cost < distances[jump]:
+                    distances[jump] = new_cost
+                    parent[jump] = current
+                    heappush(open_heap, (new_cost, counter, jump))
+                    counter += 1
+        
+        end_time = time.perf_counter_ns()
+        path = self._expand_jump_path(parent, start_idx, goal_idx) if found else []
+        return self._make_result(path, nodes_explored, end_time - start_time, found, explored_order)
+    
+    def _pack_rows(self):
+        """
+        Padded grid packed into one Python int per row (bit j = padded
+        cell j). Per row: (blocked bits, forced bits going right, forced
+        bits going left), where a forced bit j marks a cell whose side
+        cell (row above or below) is open while the side cell just behind
+        it is blocked - the place a horizontal run has to branch.
+        """
+        padded = np.pad(self.obstacle_np, 1, constant_values=True)
+        lines = [int.from_bytes(line.tobytes(), 'little')
+                 for line in np.packbits(padded, axis=1, bitorder='little')]
+        packed = [(lines[0], 0, 0)]
+        for before, line, after in zip(lines, lines[1:], lines[2:]):
+            packed.append((line,
+                           ((before << 1) & ~before) | ((after << 1) & ~after),
+                           ((before >> 1) & ~before) | ((after >> 1) & ~after)))
+        packed.append((lines[-1], 0, 0))
+        return packed
+    
+    def _jump_row(self, x, y, dy, goal):
+        """
+        Horizontal run from (x, y) in direction dy (+1 / -1). Returns the
+        column of the next jump point (forced cell or the goal), or -1 if
+        a blocked cell comes first. The blocked border ends every run.
+        """
+        line, forced_right, forced_left = self._row_scan[x + 1]
+        forced = forced_right if dy > 0 else forced_left
+        if x == goal[0]:
+            forced |= 1 << (goal[1] + 1)
+        j = y + 1  # padded position
+        if dy > 0:
+            ahead = line >> (j + 1)
+            stops = forced >> (j + 1)
+            if stops and (stops & -stops) < (ahead & -ahead):
+                return (stops & -stops).bit_length() + j - 1
+            return -1
+        behind = (1 << j) - 1
+        stop = (forced & behind).bit_length() - 1
+        return stop - 1 if stop > (line & behind).bit_length() - 1 else -1
+    
+    def _jump_col(self, x, y, dx, goal):
+        """
+        Vertical run from (x, y) in direction dx (+1 / -1). Returns the row
+        of the next jump point, or -1 if a blocked cell comes first. A cell
+        is a jump point if it is the goal, has a forced side cell, or a
+        horizontal run from it reaches a jump point.
+        """
+        blocked = self._blocked_flat
+        jump_row = self._jump_row
+        width = self.cols + 2
+        step = dx * width
+        p = (x + 1) * width + y + 1  # padded index
+        goal_x, goal_y = goal
+        while True:
+            x += dx
+            p += step
+            if blocked[p]:
+                return -1
+            if x == goal_x and y == goal_y:
+                return x
+            if ((not blocked[p - 1] and blocked[p - step - 1]) or
+                    (not blocked[p + 1] and blocked[p - step + 1])):
+                return x
+            if jump_row(x, y, 1, goal) >= 0 or jump_row(x, y, -1, goal) >= 0:
+                return x
+    
+    def _expand_jump_path(self, parent, start, goal):
+        """
+        Path through the jump points, with the straight runs between
+        consecutive jump points filled back in
+        """
+        jumps = self._reconstruct_path(parent, start, goal)
+        path = [jumps[0]]
+        for (x, y), (jx, jy) in zip(jumps, jumps[1:]):
+            dx = (jx > x) - (jx < x)
+            dy = (jy > y) - (jy < y)
+            while x != jx or y != jy:
+                x += dx
+                y += dy
+                path.append((x, y))
+        return path
+    
+    def dijkstra_many(self, queries, processes=None):
+        """
+        Run dijkstra for many independent (start, goal) queries on this
+        grid, spread over a process pool (threads would serialize on the
+        GIL). Each worker builds its own pathfinder once, from the
+        obstacle grid, and then answers its share of the queries
+        processes: pool size (default: CPU count); 1 runs in-process
+        Returns: list of result dictionaries, in query order
+        """
+        queries = list(queries)
+        if processes == 1 or len(queries) < 2:
+            return [self.dijkstra(start, goal) for start, goal in queries]
+        init_args = ((self.rows, self.cols), np.argwhere(self.obstacle_np), self.UNIT_COST)
+        with multiprocessing.Pool(processes, _init_query_worker, init_args) as pool:
+            return pool.map(_run_query, queries)
+    
+    def batch_bfs_gpu(self, sources, goals):
+        """
+        Unit-cost shortest paths for many (source, goal) pairs at once
+        Level-synchronous BFS: every search advances one level per step
+        as whole-array shifts over a (batch, rows, cols) frontier, on the
+        GPU with CuPy when it is installed, otherwise with NumPy
+        Time Complexity: O(L * B * V) array work, L = longest distance
+        Space Complexity: O(B * V)
+        Returns: list of dictionaries with path, path_length, distance, success
+        """
+        start_time = time.perf_counter_ns()
+        xp = cp if cp is not None else np
+        rows, cols = self.rows, self.cols
+        batch = len(sources)
+        src = np.asarray(sources, dtype=np.intp).reshape(batch, 2)
+        dst = np.asarray(goals, dtype=np.intp).reshape(batch, 2)
+        b_idx = xp.asarray(np.arange(batch))
+        gx, gy = xp.asarray(dst[:, 0]), xp.asarray(dst[:, 1])
+        
+        free = ~xp.asarray(self.obstacle_np)
+        frontier = xp.zeros((batch, rows, cols), dtype=bool)
+        frontier[b_idx, xp.asarray(src[:, 0]), xp.asarray(src[:, 1])] = True
+        visited = frontier.copy()
+        # Move that reached each cell: 0 Right, 1 Down, 2 Left, 3 Up (-1 = none)
+        came_from = xp.full((batch, rows, cols), -1, dtype=xp.int8)
+        distances = np.full(batch, -1, dtype=np.int64)
+        # (cells reached, cells they are reached from) for each move
+        every = slice(None)
+        shifts = (((every, every, slice(1, None)), (every, every, slice(None, -1))),   # Right
+                  ((every, slice(1, None), every), (every, slice(None, -1), every)),   # Down
+                  ((every, every, slice(None, -1)), (every, every, slice(1, None))),   # Left
+                  ((every, slice(None, -1), every), (every, slice(1, None), every)))   # Up
+        
+        level = 0
+        while True:
+            reached = frontier[b_idx, gx, gy]
+            reached = reached.get() if cp is not None else reached
+            distances[reached & (distances < 0)] = level
+            done = distances >= 0
+            # Finished searches stop expanding
+            frontier[xp.asarray(done)] = False
+            if done.all() or not bool(frontier.any()):
+                break
+            level += 1
+            
+            # Expand in the usual order: Right, Down, Left, Up
+            nxt = xp.zeros_like(frontier)
+            for code, (to_slice, from_slice) in enumerate(shifts):
+                step = xp.zeros_like(frontier)
+                step[to_slice] = frontier[from_slice]
+                step &= free
+                step &= ~visited
+                step &= ~nxt
+                came_from[step] = code
+                nxt |= step
+            visited |= nxt
+            frontier = nxt
+        
+        came_from = came_from.get() if cp is not None else came_from
+        end_time = time.perf_counter_ns()
+        
+        # Undo each move back to the source: Right, Down, Left, Up
+        back = ((0, -1), (-1, 0), (0, 1), (1, 0))
+        results = []
+        for b in range(batch):
+            path = []
+            if distances[b] >= 0:
+                x, y = int(dst[b, 0]), int(dst[b, 1])
+                path.append((x, y))
+                for _ in range(distances[b]):
+                    dx, dy = back[came_from[b, x, y]]
+                    x, y = x + dx, y + dy
+                    path.append((x, y))
+                path.reverse()
+            results.append({
+                'path': path,
+                'path_length': len(path),
+                'distance': int(distances[b]),
+                'success': bool(distances[b] >= 0),
+                'execution_time_ms': (end_time - start_time) / 1e6
+            })
+        return results
+    
+    def _make_result(self, path, nodes_explored, elapsed_ns, success, explored):
+        """
+        Result dictionary shared by every search method
+        explored: flat cell indices in expansion order
+        """
+        cols = self.cols
         return {
-            'path': [],
+            'path': path,
             'nodes_explored': nodes_explored,
-            'execution_time_ms': (end_time - start_time) * 1000,
-            'path_length': 0,
-            'success': False,
-            'explored_nodes': explored_list
+            'execution_time_ms': elapsed_ns / 1e6,
+            'path_length': len(path),
+            'success': success,
+            'explored_nodes': [divmod(i, cols) for i in explored]
         }
     
-    def _reconstruct_path(self, parent, start, goal):
+    def _reconstruct_path(self, parent, start, goal, length=None):
         """
-        Reconstruct path from start to goal using 2D parent array
+        Reconstruct path from start to goal using the flat parent array
+        Indices are unflattened to (row, col) once, on the way out
+        When the number of cells on the path (length) is known, the list
+        is allocated once and filled from the back instead of being grown
+        and reversed. parent may be a list or a NumPy array
+        Otherwise a single walk plus list.reverse() beats counting the
+        chain first: the walk is the expensive part, not the reverse
         """
+        cols = self.cols
+        # ndarray.item hands back plain ints, which index and divmod much
+        # faster than the NumPy scalars parent[current] would return
+        step = parent.item if isinstance(parent, np.ndarray) else parent.__getitem__
+        if length is not None:
+            path = [None] * length
+            current = int(goal)
+            for i in range(length - 1, -1, -1):
+                path[i] = divmod(current, cols)
+                current = step(current)
+            return path
         path = []
-        current = goal
-        while current is not None:
-            path.append(current)
-            x, y = current
-            current = parent[x][y]
+        current = int(goal)
+        while current != -1:
+            path.append(divmod(current, cols))
+            current = step(current)
         path.reverse()
         return path
 
+# Per-process pathfinder for dijkstra_many, set by the pool initializer
+_worker_pathfinder = None
+
+
+def _init_query_worker(grid, obstacles, unit_cost):
+    """Pool initializer: build this worker's pathfinder once"""
+    global _worker_pathfinder
+    _worker_pathfinder = DijkstraPathfinder(grid, obstacles)
+    _worker_pathfinder.UNIT_COST = unit_cost
+
+
+def _run_query(query):
+    """Pool task: answer one (start, goal) query in this worker"""
+    start, goal = query
+    return _worker_pathfinder.dijkstra(start, goal)
+
+
 def visualize_pathfinding(rows, cols, obstacles, start, goal, result):
     """
     Visualize the pathfinding process using matplotlib
     """
+    # Imported here, not at module level, so dijkstra_many's pool workers
+    # and the GUIs that only need DijkstraPathfinder never load pyplot
+    import matplotlib.pyplot as plt
+    import matplotlib.patches as patches
+    from matplotlib.colors import ListedColormap
+
     # Create figure and axis
     fig, ax = plt.subplots(figsize=(12, 10))
     
     # Create grid visualization
-    grid = np.zeros((rows, cols))
+    grid = np.zeros((rows, cols), dtype=np.uint8)
     
-    # Mark obstacles (value = 1)
-    for obs in obstacles:
-        grid[obs[0]][obs[1]] = 1
-    
-    # Mark explored nodes (value = 2)
-    if 'explored_nodes' in result:
-        for node in result['explored_nodes']:
-            if node != start and node != goal:
-                grid[node[0]][node[1]] = 2
-    
-    # Mark path (value = 3)
-    if result['success']:
-        for node in result['path']:
-            if node != start and node != goal:
-                grid[node[0]][node[1]] = 3
+    # Mark obstacles (value = 1), explored nodes (value = 2) and the path
+    # (value = 3) with one indexed write per layer. Start and goal are
+    # painted last, so they need not be filtered out of the layers
+    layers = ((obstacles, 1),
+              (result.get('explored_nodes', []), 2),
+              (result['path'] if result['success'] else [], 3))
+    for cells, value in layers:
+        cells = np.asarray(cells, dtype=np.intp).reshape(-1, 2)
+        grid[cells[:, 0], cells[:, 1]] = value
     
     # Mark start (value = 4) and goal (value = 5)
     grid[start[0]][start[1]] = 4
@@ -211,7 +1105,7 @@ def visualize_pathfinding(rows, cols, obstacles, start, goal, result):
     cmap = ListedColormap(colors)
     
     # Plot the grid
-    im = ax.imshow(grid, cmap=cmap, interpolation='nearest', origin='upper')
+    im = ax.imshow(grid, cmap=cmap, interpolation='nearest', origin='upper', vmin=0, vmax=5)
     
     # Add grid lines
     ax.set_xticks(np.arange(-0.5, cols, 1), minor=True)
@@ -259,133 +1153,137 @@ def run_dijkstra_analysis():
     """
     Main function to run Dijkstra's algorithm with user input
     """
-    print("\n" + "=" * 80)
-    print("DIJKSTRA'S ALGORITHM - PATH FINDING RESEARCH ANALYSIS")
-    print("=" * 80)
-    print("Unit Cost: 1 (fixed for all movements)")
-    print("Movement: 4-directional (up, down, left, right)")
-    print("=" * 80)
-    
-    # Get grid dimensions
-    print("\n📐 GRID SETUP")
-    print("-" * 80)
-    rows = int(input("Enter number of rows: "))
-    cols = int(input("Enter number of columns: "))
-    print(f"✓ Grid size: {rows} x {cols} ({rows * cols} total cells)")
-    
-    # Get obstacles
-    print("\n🚧 OBSTACLES SETUP")
-    print("-" * 80)
-    print("Enter obstacles as 'row,col' (one per line)")
-    print("Type 'done' when finished")
-    print("Example: 1,2")
-    
-    obstacles = []
     while True:
-        obstacle_input = input("Obstacle (or 'done'): ").strip()
-        if obstacle_input.lower() == 'done':
-            break
-        try:
-            r, c = map(int, obstacle_input.split(','))
-            if 0 <= r < rows and 0 <= c < cols:
-                obstacles.append((r, c))
-                print(f"  ✓ Added obstacle at ({r}, {c})")
-            else:
-                print(f"  ✗ Position ({r}, {c}) is out of bounds!")
-        except:
-            print("  ✗ Invalid format! Use: row,col")
+        print("\n" + "=" * 80)
+        print("DIJKSTRA'S ALGORITHM - PATH FINDING RESEARCH ANALYSIS")
+        print("=" * 80)
+        print("Unit Cost: 1 (fixed for all movements)")
+        print("Movement: 4-directional (up, down, left, right)")
+        print("=" * 80)
     
-    print(f"\n✓ Total obstacles: {len(obstacles)}")
+        # Get grid dimensions
+        print("\n📐 GRID SETUP")
+        print("-" * 80)
+        rows = int(input("Enter number of rows: "))
+        cols = int(input("Enter number of columns: "))
+        print(f"✓ Grid size: {rows} x {cols} ({rows * cols} total cells)")
     
-    # Get start and goal
-    print("\n🎯 START & GOAL POSITIONS")
-    print("-" * 80)
+        # Get obstacles
+        print("\n🚧 OBSTACLES SETUP")
+        print("-" * 80)
+        print("Enter obstacles as 'row,col' (one per line)")
+        print("Type 'done' when finished")
+        print("Example: 1,2")
     
-    while True:
-        start_input = input("Enter start position (row,col): ").strip()
-        try:
-            sr, sc = map(int, start_input.split(','))
-            if 0 <= sr < rows and 0 <= sc < cols:
-                if (sr, sc) not in obstacles:
-                    start = (sr, sc)
-                    print(f"  ✓ Start: ({sr}, {sc})")
-                    break
+        obstacles = []
+        while True:
+            obstacle_input = input("Obstacle (or 'done'): ").strip()
+            if obstacle_input.lower() == 'done':
+                break
+            try:
+                r, c = map(int, obstacle_input.split(','))
+                if 0 <= r < rows and 0 <= c < cols:
+                    obstacles.append((r, c))
+                    print(f"  ✓ Added obstacle at ({r}, {c})")
                 else:
-                    print("  ✗ Start position cannot be an obstacle!")
-            else:
-                print("  ✗ Position out of bounds!")
-        except:
-            print("  ✗ Invalid format! Use: row,col")
+                    print(f"  ✗ Position ({r}, {c}) is out of bounds!")
+            except:
+                print("  ✗ Invalid format! Use: row,col")
     
-    while True:
-        goal_input = input("Enter goal position (row,col): ").strip()
-        try:
-            gr, gc = map(int, goal_input.split(','))
-            if 0 <= gr < rows and 0 <= gc < cols:
-                if (gr, gc) not in obstacles:
-                    goal = (gr, gc)
-                    print(f"  ✓ Goal: ({gr}, {gc})")
-                    break
+        print(f"\n✓ Total obstacles: {len(obstacles)}")
+    
+        # Get start and goal
+        print("\n🎯 START & GOAL POSITIONS")
+        print("-" * 80)
+    
+        while True:
+            start_input = input("Enter start position (row,col): ").strip()
+            try:
+                sr, sc = map(int, start_input.split(','))
+                if 0 <= sr < rows and 0 <= sc < cols:
+                    if (sr, sc) not in obstacles:
+                        start = (sr, sc)
+                        print(f"  ✓ Start: ({sr}, {sc})")
+                        break
+                    else:
+                        print("  ✗ Start position cannot be an obstacle!")
                 else:
-                    print("  ✗ Goal position cannot be an obstacle!")
-            else:
-                print("  ✗ Position out of bounds!")
-        except:
-            print("  ✗ Invalid format! Use: row,col")
+                    print("  ✗ Position out of bounds!")
+            except:
+                print("  ✗ Invalid format! Use: row,col")
     
-    # Run Dijkstra's algorithm
-    print("\n\n" + "=" * 80)
-    print("RUNNING DIJKSTRA'S ALGORITHM...")
-    print("=" * 80)
+        while True:
+            goal_input = input("Enter goal position (row,col): ").strip()
+            try:
+                gr, gc = map(int, goal_input.split(','))
+                if 0 <= gr < rows and 0 <= gc < cols:
+                    if (gr, gc) not in obstacles:
+                        goal = (gr, gc)
+                        print(f"  ✓ Goal: ({gr}, {gc})")
+                        break
+                    else:
+                        print("  ✗ Goal position cannot be an obstacle!")
+                else:
+                    print("  ✗ Position out of bounds!")
+            except:
+                print("  ✗ Invalid format! Use: row,col")
     
-    pathfinder = DijkstraPathfinder((rows, cols), obstacles)
-    result = pathfinder.dijkstra(start, goal)
+        # Run Dijkstra's algorithm
+        print("\n\n" + "=" * 80)
+        print("RUNNING DIJKSTRA'S ALGORITHM...")
+        print("=" * 80)
     
-    # Display results
-    print("\n" + "=" * 80)
-    print("RESEARCH PARAMETERS - DIJKSTRA'S ALGORITHM RESULTS")
-    print("=" * 80)
+        pathfinder = DijkstraPathfinder((rows, cols), obstacles)
+        result = pathfinder.dijkstra(start, goal, record_trace=True)
     
-    if result['success']:
-        print("\n✓ PATH FOUND!")
-        print("-" * 80)
-        print(f"\na) Total Time Taken:           {result['execution_time_ms']:.6f} ms")
-        print(f"b) Nodes/Cells Explored:       {result['nodes_explored']} nodes")
-        print(f"c) Nodes in Final Path:        {result['path_length']} nodes")
-        print()
-        print(f"Path Cost:                     {result['path_length'] - 1} (with unit cost = 1)")
-        print()
-        
-        # Display path
-        if result['path_length'] <= 20:
-            print(f"Complete Path:")
-            print(f"{' → '.join([f'({x},{y})' for x, y in result['path']])}")
-        else:
-            print(f"Path (first 5 and last 5 nodes):")
-            first_5 = ' → '.join([f'({x},{y})' for x, y in result['path'][:5]])
-            last_5 = ' → '.join([f'({x},{y})' for x, y in result['path'][-5:]])
-            print(f"{first_5} ... {last_5}")
+        # Display results
+        print("\n" + "=" * 80)
+        print("RESEARCH PARAMETERS - DIJKSTRA'S ALGORITHM RESULTS")
+        print("=" * 80)
+    
+        if result['success']:
+            print("\n✓ PATH FOUND!")
+            print("-" * 80)
+            print(f"\na) Total Time Taken:           {result['execution_time_ms']:.6f} ms")
+            print(f"b) Nodes/Cells Explored:       {result['nodes_explored']} nodes")
+            print(f"c) Nodes in Final Path:        {result['path_length']} nodes")
+            print()
+            print(f"Path Cost:                     {result['path_length'] - 1} (with unit cost = 1)")
+            print()
         
-    else:
-        print("\n✗ NO PATH FOUND!")
-        print("-" * 80)
-        print(f"\na) Total Time Taken:           {result['execution_time_ms']:.6f} ms")
-        print(f"b) Nodes/Cells Explored:       {result['nodes_explored']} nodes")
-        print(f"c) Nodes in Final Path:        0 nodes (no path exists)")
-        print("\nReason: The goal is unreachable from the start position.")
-    
-    print("\n" + "=" * 80)
-    print("ANALYSIS COMPLETE")
-    print("=" * 80)
-    
-    # Visualize the pathfinding
-    print("\n📊 Generating visualization...")
-    visualize_pathfinding(rows, cols, obstacles, start, goal, result)
-    
-    # Ask if user wants to test another scenario
-    print("\nWould you like to test another scenario? (y/n): ", end="")
-    if input().strip().lower() == 'y':
-        run_dijkstra_analysis()
+            # Display path
+            if result['path_length'] <= 20:
+                print(f"Complete Path:")
+                print(f"{' → '.join([f'({x},{y})' for x, y in result['path']])}")
+            else:
+                print(f"Path (first 5 and last 5 nodes):")
+                first_5 = ' → '.join([f'({x},{y})' for x, y in result['path'][:5]])
+                last_5 = ' → '.join([f'({x},{y})' for x, y in result['path'][-5:]])
+                print(f"{first_5} ... {last_5}")
+        
+        else:
+            print("\n✗ NO PATH FOUND!")
+            print("-" * 80)
+            print(f"\na) Total Time Taken:           {result['execution_time_ms']:.6f} ms")
+            print(f"b) Nodes/Cells Explored:       {result['nodes_explored']} nodes")
+            print(f"c) Nodes in Final Path:        0 nodes (no path exists)")
+            print("\nReason: The goal is unreachable from the start position.")
+    
+        print("\n" + "=" * 80)
+        print("ANALYSIS COMPLETE")
+        print("=" * 80)
+    
+        # Visualize the pathfinding
+        print("\n📊 Generating visualization...")
+        visualize_pathfinding(rows, cols, obstacles, start, goal, result)
+        # Release this scenario's grid arrays and exploration trace now
+        # rather than while the next one is being typed in
+        del pathfinder, result
+    
+        # Ask if user wants to test another scenario
+        print("\nWould you like to test another scenario? (y/n): ", end="")
+        if input().strip().lower() != 'y':
+            break
 
 
 if __name__ == "__main__":
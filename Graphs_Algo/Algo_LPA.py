@@ -3,10 +3,7 @@ import math
 import time
 from typing import Dict, List, Optional, Set, Tuple
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
 import numpy as np
-from matplotlib.colors import ListedColormap
 
 GridNode = Tuple[int, int]
 
@@ -383,8 +380,13 @@ def visualize_lpa_result(
     result: Dict[str, object],
     title_prefix: str = "LPA*",
 ) -> None:
+    # pyplot is only needed for this plot, not by lpa_gui
+    import matplotlib.pyplot as plt
+    import matplotlib.patches as patches
+    from matplotlib.colors import ListedColormap
+
     fig, ax = plt.subplots(figsize=(12, 10))
-    grid = np.zeros((rows, cols), dtype=np.int32)
+    grid = np.zeros((rows, cols), dtype=np.uint8)
 
     expanded_nodes_obj = result.get("expanded_nodes", [])
     expanded_nodes = expanded_nodes_obj if isinstance(expanded_nodes_obj, list) else []
@@ -392,17 +394,16 @@ def visualize_lpa_result(
     path_nodes_obj = result.get("path", [])
     path_nodes = path_nodes_obj if isinstance(path_nodes_obj, list) else []
 
-    for obs in obstacles:
-        grid[obs[0]][obs[1]] = 1
-
-    for node in expanded_nodes:
-        if node != start and node != goal:
-            grid[node[0]][node[1]] = 2
-
-    if result.get("success", False):
-        for node in path_nodes:
-            if node != start and node != goal:
-                grid[node[0]][node[1]] = 3
+    # One indexed write per layer; start and goal are painted last, so they
+    # need not be filtered out of the layers
+    layers = (
+        (obstacles, 1),
+        (expanded_nodes, 2),
+        (path_nodes if result.get("success", False) else [], 3),
+    )
+    for cells, value in layers:
+        cells = np.asarray(cells, dtype=np.intp).reshape(-1, 2)
+        grid[cells[:, 0], cells[:, 1]] = value
 
     grid[start[0]][start[1]] = 4
     grid[goal[0]][goal[1]] = 5
@@ -410,7 +411,7 @@ def visualize_lpa_result(
     colors = ["white", "black", "#9bd4f8", "#47b647", "#d63636", "#ffd24d"]
     cmap = ListedColormap(colors)
 
-    ax.imshow(grid, cmap=cmap, interpolation="nearest", origin="upper")
+    ax.imshow(grid, cmap=cmap, interpolation="nearest", origin="upper", vmin=0, vmax=5)
 
     ax.set_xticks(np.arange(-0.5, cols, 1), minor=True)
     ax.set_yticks(np.arange(-0.5, rows, 1), minor=True)
@@ -0,0 +1,269 @@
+# distutils: language = c++
+# cython: boundscheck=False, wraparound=False, cdivision=True, language_level=3
+"""
+Optional C extension for the grid pathfinders.
+
+Build in place with:  cythonize -i Graphs_Algo/_astar_cy.pyx
+Algo_AStar / Algo_Dij pick it up automatically when the compiled module
+is importable and fall back to Numba / pure Python otherwise.
+Cells are encoded as x * cols + y, like the Numba kernel.
+"""
+import numpy as np
+
+from libcpp.queue cimport priority_queue, queue
+from libcpp.pair cimport pair
+from libc.math cimport INFINITY
+
+# (-f, -counter) so the max-heap pops the smallest f, FIFO on ties
+ctypedef pair[double, long long] Key
+ctypedef pair[Key, int] Entry
+
+
+cdef class CAStar:
+    """
+    8-direction A* over a uint8 obstacle grid.
+    Same heap keys, tie-breaking and stale-entry skipping as
+    AStarPathfinder._astar_python, so it expands the same nodes in the
+    same order.
+    """
+    cdef int rows, cols
+    cdef const unsigned char[:, ::1] obstacle
+    cdef double straight_cost, diagonal_cost
+
+    def __init__(self, obstacle, double straight_cost, double diagonal_cost):
+        self.obstacle = np.ascontiguousarray(obstacle, dtype=np.uint8)
+        self.rows = self.obstacle.shape[0]
+        self.cols = self.obstacle.shape[1]
+        self.straight_cost = straight_cost
+        self.diagonal_cost = diagonal_cost
+
+    cpdef astar_c(self, const double[:, ::1] heuristic, int sx, int sy, int gx, int gy):
+        """
+        Returns (parent, g_scores, discovered, n_discovered, expanded, n_expanded, found)
+        """
+        cdef int rows = self.rows, cols = self.cols
+        cdef int size = rows * cols
+        g_np = np.full(size, np.inf, np.float64)
+        parent_np = np.full(size, -1, np.int32)
+        discovered_np = np.empty(size, np.int32)
+        expanded_np = np.empty(size, np.int32)
+        cdef double[::1] g_scores = g_np
+        cdef int[::1] parent = parent_np
+        cdef int[::1] discovered = discovered_np
+        cdef int[::1] expanded = expanded_np
+        cdef unsigned char[::1] explored = np.zeros(size, np.uint8)
+        cdef unsigned char[::1] seen = np.zeros(size, np.uint8)
+        # Counter of each cell's newest push. Older entries for the cell
+        # are stale (its g has dropped since) and are skipped on pop, like
+        # the current_g > g_scores test in the Python search
+        cdef long long[::1] latest = np.empty(size, np.int64)
+        cdef const unsigned char[:, ::1] obstacle = self.obstacle
+        cdef double straight_cost = self.straight_cost
+        cdef double diagonal_cost = self.diagonal_cost
+
+        cdef int dxs[8]
+        cdef int dys[8]
+        dxs[:] = [0, 1, 0, -1, -1, 1, 1, -1]
+        dys[:] = [1, 0, -1, 0, 1, 1, -1, -1]
+
+        cdef priority_queue[Entry] open_heap
+        cdef int start = sx * cols + sy
+        cdef int goal = gx * cols + gy
+        cdef int n_discovered = 1, n_expanded = 0
+        cdef long long counter = 1
+        cdef bint found = False, stale
+        cdef int cur, x, y, k, nx, ny, nb
+        cdef double current_g, tentative_g
+
+        with nogil:
+            g_scores[start] = 0.0
+            seen[start] = 1
+            discovered[0] = start
+            latest[start] = 0
+            open_heap.push(Entry(Key(-heuristic[sx, sy], 0), start))
+
+            while not open_heap.empty():
+                cur = open_heap.top().second
+                stale = -open_heap.top().first.second != latest[cur]
+                open_heap.pop()
+                if explored[cur] or stale:
+                    continue
+                explored[cur] = 1
+                expanded[n_expanded] = cur
+                n_expanded += 1
+                if cur == goal:
+                    found = True
+                    break
+
+                x = cur // cols
+                y = cur - x * cols
+                current_g = g_scores[cur]
+                for k in range(8):
+                    nx = x + dxs[k]
+                    ny = y + dys[k]
+                    # Negative coordinates wrap to huge unsigned values,
+                    # so one compare per axis is the whole bounds check
+                    if <unsigned int>nx >= <unsigned int>rows or <unsigned int>ny >= <unsigned int>cols:
+                        continue
+                    if obstacle[nx, ny]:
+                        continue
+                    nb = nx * cols + ny
+                    if explored[nb]:
+                        continue
+                    tentative_g = current_g + (straight_cost if k < 4 else diagonal_cost)
+                    if tentative_g < g_scores[nb]:
+                        g_scores[nb] = tentative_g
+                        parent[nb] = cur
+                        latest[nb] = counter
+                        open_heap.push(Entry(Key(-(tentative_g + heuristic[nx, ny]), -counter), nb))
+                        counter += 1
+                        if not seen[nb]:
+                            seen[nb] = 1
+                            discovered[n_discovered] = nb
+                            n_discovered += 1
+
+        return parent_np, g_np, discovered_np, n_discovered, expanded_np, n_expanded, found
+
+
+cdef class CDijkstra:
+    """
+    4-direction Dijkstra / unit-cost BFS over a uint8 obstacle grid.
+    Same neighbor order as DijkstraPathfinder.dijkstra.
+    """
+    cdef int rows, cols
+    cdef const unsigned char[:, ::1] obstacle
+
+    def __init__(self, obstacle):
+        self.obstacle = np.ascontiguousarray(obstacle, dtype=np.uint8)
+        self.rows = self.obstacle.shape[0]
+        self.cols = self.obstacle.shape[1]
+
+    cpdef bfs_c(self, int sx, int sy, int gx, int gy):
+        """
+        Returns (parent, explored_order, n_explored, found)
+        """
+        cdef int rows = self.rows, cols = self.cols
+        cdef int size = rows * cols
+        parent_np = np.full(size, -1, np.int32)
+        order_np = np.empty(size, np.int32)
+        cdef int[::1] parent = parent_np
+        cdef int[::1] order = order_np
+        cdef unsigned char[::1] visited = np.zeros(size, np.uint8)
+        cdef const unsigned char[:, ::1] obstacle = self.obstacle
+
+        cdef queue[int] fifo
+        cdef int start = sx * cols + sy
+        cdef int goal = gx * cols + gy
+        cdef int n_explored = 0
+        cdef bint found = False
+        cdef int cur, x, y, k, nx, ny, nb
+
+        cdef int dxs[4]
+        cdef int dys[4]
+        # Right, Down, Left, Up
+        dxs[:] = [0, 1, 0, -1]
+        dys[:] = [1, 0, -1, 0]
+
+        with nogil:
+            visited[start] = 1
+            fifo.push(start)
+            while not fifo.empty():
+                cur = fifo.front()
+                fifo.pop()
+                order[n_explored] = cur
+                n_explored += 1
+                if cur == goal:
+                    found = True
+                    break
+
+                x = cur // cols
+                y = cur - x * cols
+                for k in range(4):
+                    nx = x + dxs[k]
+                    ny = y + dys[k]
+                    # Negative coordinates wrap to huge unsigned values,
+                    # so one compare per axis is the whole bounds check
+                    if <unsigned int>nx >= <unsigned int>rows or <unsigned int>ny >= <unsigned int>cols:
+                        continue
+                    nb = nx * cols + ny
+                    if obstacle[nx, ny] or visited[nb]:
+                        continue
+                    visited[nb] = 1
+                    parent[nb] = cur
+                    fifo.push(nb)
+                # Goal reached on enqueue: its BFS distance is already final
+                if visited[goal]:
+                    order[n_explored] = goal
+                    n_explored += 1
+                    found = True
+                    break
+
+        return parent_np, order_np, n_explored, found
+
+    cpdef dijkstra_c(self, int sx, int sy, int gx, int gy, double unit_cost):
+        """
+        Same heap keys and tie-breaking as DijkstraPathfinder.dijkstra.
+        Returns (parent, explored_order, n_explored, found)
+        """
+        cdef int rows = self.rows, cols = self.cols
+        cdef int size = rows * cols
+        dist_np = np.full(size, np.inf, np.float64)
+        parent_np = np.full(size, -1, np.int32)
+        order_np = np.empty(size, np.int32)
+        cdef double[::1] distances = dist_np
+        cdef int[::1] parent = parent_np
+        cdef int[::1] order = order_np
+        cdef const unsigned char[:, ::1] obstacle = self.obstacle
+
+        cdef priority_queue[Entry] open_heap
+        cdef int start = sx * cols + sy
+        cdef int goal = gx * cols + gy
+        cdef int n_explored = 0
+        cdef long long counter = 1
+        cdef bint found = False
+        cdef int cur, x, y, k, nx, ny, nb
+        cdef double new_cost
+
+        cdef int dxs[4]
+        cdef int dys[4]
+        # Right, Down, Left, Up
+        dxs[:] = [0, 1, 0, -1]
+        dys[:] = [1, 0, -1, 0]
+
+        with nogil:
+            distances[start] = 0.0
+            open_heap.push(Entry(Key(0.0, 0), start))
+            while not open_heap.empty():
+                cur = open_heap.top().second
+                open_heap.pop()
+                order[n_explored] = cur
+                n_explored += 1
+                if cur == goal:
+                    found = True
+                    break
+
+                x = cur // cols
+                y = cur - x * cols
+                # Every move costs the same, so each cell is pushed once
+                # with its final distance and no stale entries are popped
+                new_cost = distances[cur] + unit_cost
+                for k in range(4):
+                    nx = x + dxs[k]
+                    ny = y + dys[k]
+                    if <unsigned int>nx >= <unsigned int>rows or <unsigned int>ny >= <unsigned int>cols:
+                        continue
+                    nb = nx * cols + ny
+                    if obstacle[nx, ny] or new_cost >= distances[nb]:
+                        continue
+                    distances[nb] = new_cost
+                    parent[nb] = cur
+                    open_heap.push(Entry(Key(-new_cost, -counter), nb))
+                    counter += 1
+                # Goal reached on push: its distance is already final
+                if distances[goal] < INFINITY:
+                    order[n_explored] = goal
+                    n_explored += 1
+                    found = True
+                    break
+
+        return parent_np, order_np, n_explored, found
@@ -0,0 +1,108 @@
+"""
+Indexed d-ary min-heap used by the compiled A* kernel.
+
+The heap lives in three parallel arrays (key, insertion counter, cell
+index) plus heap_pos, which maps a cell index to its heap slot (-1 when
+not queued) so a queued cell's key can be replaced in place. Ties on the
+key are broken by the counter, so equal keys pop first-in first-out.
+Compiled with Numba when it is installed, plain Python otherwise.
+"""
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the kernels then run as plain Python
+    njit = None
+
+
+def _jit(fn):
+    """
+    Compile fn with Numba when it is installed, otherwise return it as-is.
+    The heap helpers are inlined into the kernels that call them, so the
+    shared sift loops cost no call per push or pop.
+    """
+    return njit(cache=True, inline="always")(fn) if njit is not None else fn
+
+
+# Arity of the open-list heap. A 4-ary heap is half as deep as a
+# binary heap and keeps each node's children adjacent in memory.
+HEAP_ARITY = 4
+
+
+@_jit
+def dary_sift_up(heap_f, heap_c, heap_idx, heap_pos, i, f, c, idx):
+    """Move (f, c, idx) up from slot i to its place, keeping heap_pos in sync."""
+    while i > 0:
+        p = (i - 1) // HEAP_ARITY
+        if heap_f[p] < f or (heap_f[p] == f and heap_c[p] < c):
+            break
+        heap_f[i] = heap_f[p]
+        heap_c[i] = heap_c[p]
+        heap_idx[i] = heap_idx[p]
+        heap_pos[heap_idx[i]] = i
+        i = p
+    heap_f[i] = f
+    heap_c[i] = c
+    heap_idx[i] = idx
+    heap_pos[idx] = i
+
+
+@_jit
+def dary_sift_down(heap_f, heap_c, heap_idx, heap_pos, size, i, f, c, idx):
+    """Move (f, c, idx) down from slot i to its place, keeping heap_pos in sync."""
+    first = HEAP_ARITY * i + 1
+    while first < size:
+        # Smallest of the (up to) HEAP_ARITY adjacent children
+        best = first
+        best_f = heap_f[first]
+        best_c = heap_c[first]
+        last = first + HEAP_ARITY
+        if last > size:
+            last = size
+        for child in range(first + 1, last):
+            child_f = heap_f[child]
+            if child_f < best_f or (child_f == best_f and heap_c[child] < best_c):
+                best = child
+                best_f = child_f
+                best_c = heap_c[child]
+        if f < best_f or (f == best_f and c < best_c):
+            break
+        heap_f[i] = best_f
+        heap_c[i] = best_c
+        heap_idx[i] = heap_idx[best]
+        heap_pos[heap_idx[i]] = i
+        i = best
+        first = HEAP_ARITY * i + 1
+    heap_f[i] = f
+    heap_c[i] = c
+    heap_idx[i] = idx
+    heap_pos[idx] = i
+
+
+@_jit
+def dary_push(heap_f, heap_c, heap_idx, heap_pos, size, f, c, idx):
+    """
+    Push (f, c, idx) onto the indexed d-ary min-heap, or replace its key if
+    idx is already queued (heap_pos[idx] >= 0); return the new size.
+    A replaced key takes the new counter c, as a fresh push would. When f
+    is unchanged that makes the key larger, so the entry sifts down.
+    """
+    i = heap_pos[idx]
+    if i >= 0:
+        if f < heap_f[i]:
+            dary_sift_up(heap_f, heap_c, heap_idx, heap_pos, i, f, c, idx)
+        else:
+            dary_sift_down(heap_f, heap_c, heap_idx, heap_pos, size, i, f, c, idx)
+        return size
+    dary_sift_up(heap_f, heap_c, heap_idx, heap_pos, size, f, c, idx)
+    return size + 1
+
+
+@_jit
+def dary_pop(heap_f, heap_c, heap_idx, heap_pos, size):
+    """Pop the minimum (f, c) entry of the d-ary heap; return (idx, new size)."""
+    top = heap_idx[0]
+    heap_pos[top] = -1
+    size -= 1
+    if size > 0:
+        dary_sift_down(heap_f, heap_c, heap_idx, heap_pos, size, 0,
+                       heap_f[size], heap_c[size], heap_idx[size])
+    return top, size
@@ -8,54 +8,44 @@ matplotlib.use('Agg')  # Non-interactive backend for saving
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 from matplotlib.colors import ListedColormap
-from matplotlib.animation import FuncAnimation
+from matplotlib.transforms import Bbox
 import numpy as np
-import random
-import time
+from PIL import Image
 
 from Algo_AStar import AStarPathfinder
 
 # Fixed grid size
 ROWS, COLS = 10, 10
 MIN_OBSTACLES = 20
+# Rough cap on exploration frames: bigger searches mark several
+# explored nodes per frame
+MAX_EXPLORE_FRAMES = 250
 
 def generate_random_obstacles(rows, cols, start, goal, min_obstacles=20):
     """Generate random obstacles ensuring path exists"""
-    max_attempts = 100
-    
-    for attempt in range(max_attempts):
-        # Generate random number of obstacles (between min_obstacles and 35% of grid)
-        num_obstacles = random.randint(min_obstacles, int(rows * cols * 0.35))
-        obstacles = []
-        
-        # Generate random positions
-        while len(obstacles) < num_obstacles:
-            r = random.randint(0, rows - 1)
-            c = random.randint(0, cols - 1)
-            
-            # Don't place obstacle on start or goal
-            if (r, c) != start and (r, c) != goal and (r, c) not in obstacles:
-                obstacles.append((r, c))
-        
-        # Test if path exists
-        pathfinder = AStarPathfinder((rows, cols), obstacles)
-        result = pathfinder.astar(start, goal)
-        
-        if result['success']:
-            print(f"✓ Generated {len(obstacles)} random obstacles (attempt {attempt + 1})")
-            return obstacles, result
-    
-    # Fallback: use fewer obstacles
-    print(f"⚠ Using fewer obstacles to ensure path exists")
-    obstacles = []
-    while len(obstacles) < min_obstacles:
-        r = random.randint(0, rows - 1)
-        c = random.randint(0, cols - 1)
-        if (r, c) != start and (r, c) != goal and (r, c) not in obstacles:
-            obstacles.append((r, c))
+    rng = np.random.default_rng()
+    # Keep a random monotone staircase from start to goal free of obstacles:
+    # every layout drawn around it is solvable, so one search is enough and
+    # no retry loop is needed. Its cells are 4-connected, which is a valid
+    # path for both the 4- and 8-direction searches
+    dr, dc = goal[0] - start[0], goal[1] - start[1]
+    moves = np.repeat([[np.sign(dr), 0], [0, np.sign(dc)]], [abs(dr), abs(dc)], axis=0)
+    rng.shuffle(moves)
+    corridor = np.asarray(start) + np.cumsum(moves, axis=0)
+    # Flat indices of every cell off the corridor and not start or goal;
+    # drawing from them without replacement needs no membership tests
+    free = np.setdiff1d(np.arange(rows * cols),
+                        np.r_[start[0] * cols + start[1], corridor[:, 0] * cols + corridor[:, 1]])
+    max_obstacles = min(int(rows * cols * 0.35), free.size)
+    num_obstacles = int(rng.integers(min(min_obstacles, max_obstacles), max_obstacles, endpoint=True))
+    # (num_obstacles, 2) array of (row, col) pairs, which the pathfinder
+    # and the grid writes index with directly
+    obstacles = np.column_stack(
+        np.divmod(rng.choice(free, size=num_obstacles, replace=False), cols))
     
     pathfinder = AStarPathfinder((rows, cols), obstacles)
-    result = pathfinder.astar(start, goal)
+    result = pathfinder.astar(start, goal, record_trace=True)
+    print(f"✓ Generated {len(obstacles)} random obstacles")
     return obstacles, result
 
 def animate_pathfinding():
@@ -92,6 +82,15 @@ def animate_pathfinding():
     # Prepare animation data
     explored_nodes = result['explored_nodes']
     path_nodes = result['path']
+    # Cells as packed keys row * COLS + col: the per-frame start / goal
+    # checks become int compares and grid writes go through grid.flat
+    start_key = start[0] * COLS + start[1]
+    goal_key = goal[0] * COLS + goal[1]
+    explored_keys = [r * COLS + c for r, c in explored_nodes]
+    path_keys = [r * COLS + c for r, c in path_nodes]
+    # Explored nodes marked per frame, and the frames that takes
+    explore_stride = max(1, len(explored_nodes) // MAX_EXPLORE_FRAMES)
+    explore_frames = -(-len(explored_nodes) // explore_stride)  # Ceiling division
     
     # Create figure
     fig, ax = plt.subplots(figsize=(12, 10))
@@ -101,11 +100,10 @@ def animate_pathfinding():
     cmap = ListedColormap(colors)
     
     # Initialize grid
-    grid = np.zeros((ROWS, COLS))
+    grid = np.zeros((ROWS, COLS), dtype=np.uint8)
     
-    # Mark obstacles
-    for obs in obstacles:
-        grid[obs[0]][obs[1]] = 1
+    # Mark obstacles with one indexed write
+    grid[obstacles[:, 0], obstacles[:, 1]] = 1
     
     # Mark start and goal
     grid[start[0]][start[1]] = 4
@@ -146,25 +144,32 @@ def animate_pathfinding():
               fontsize=11, frameon=True, shadow=True)
     
     # Animation parameters
-    total_frames = len(explored_nodes) + len(path_nodes) + 20  # Extra frames at end
+    total_frames = explore_frames + len(path_nodes) + 20  # Extra frames at end
+    
+    dirty = []  # (key, value) of cells changed since the last rendered frame
+    
+    def mark(key, value):
+        """Set a grid cell and queue it for the next rendered frame"""
+        grid.flat[key] = value
+        dirty.append((key, value))
     
     def update(frame):
         """Update function for animation"""
-        nonlocal grid
         
         # Phase 1: Show exploration
-        if frame < len(explored_nodes):
-            node = explored_nodes[frame]
-            if node != start and node != goal:
-                grid[node[0]][node[1]] = 2  # Mark as explored
-            title.set_text(f"A* Algorithm - Exploring Nodes ({frame + 1}/{len(explored_nodes)})")
+        if frame < explore_frames:
+            end = min((frame + 1) * explore_stride, len(explored_nodes))
+            for key in explored_keys[frame * explore_stride:end]:
+                if key != start_key and key != goal_key:
+                    mark(key, 2)  # Mark as explored
+            title.set_text(f"A* Algorithm - Exploring Nodes ({end}/{len(explored_nodes)})")
         
         # Phase 2: Show path
-        elif frame < len(explored_nodes) + len(path_nodes):
-            path_idx = frame - len(explored_nodes)
-            node = path_nodes[path_idx]
-            if node != start and node != goal:
-                grid[node[0]][node[1]] = 3  # Mark as path
+        elif frame < explore_frames + len(path_nodes):
+            path_idx = frame - explore_frames
+            key = path_keys[path_idx]
+            if key != start_key and key != goal_key:
+                mark(key, 3)  # Mark as path
             title.set_text(f"A* Algorithm - Building Path ({path_idx + 1}/{len(path_nodes)})")
         
         # Phase 3: Final result
@@ -172,21 +177,65 @@ def animate_pathfinding():
             title.set_text(f"A* Algorithm - Complete! Path Length: {result['path_length']}, "
                           f"Nodes Explored: {result['nodes_explored']}")
         
-        im.set_array(grid)
-        return [im, title]
-    
-    # Create animation
-    anim = FuncAnimation(fig, update, frames=total_frames, interval=100, blit=True, repeat=True)
+        return [title]
     
-    # Save animation
+    # Render the frames on one canvas without re-rendering the grid image:
+    # the figure is drawn once with every cell in each colour a frame can
+    # set, and a frame copies just its changed cells' pixel blocks (cell
+    # borders included) out of those renders, then redraws the title over
+    # a saved copy of the band above the axes
     output_file = 'astar_animation.gif'
     print(f"\n📹 Creating animation... (this may take a moment)")
-    anim.save(output_file, writer='pillow', fps=10)
+    title.set_animated(True)
+    cell_renders = {}
+    for value in (2, 3):
+        im.set_array(np.full_like(grid, value))
+        fig.canvas.draw()
+        cell_renders[value] = np.asarray(fig.canvas.buffer_rgba()).copy()
+    im.set_array(grid)
+    fig.canvas.draw()
+    title_background = fig.canvas.copy_from_bbox(
+        Bbox.from_extents(fig.bbox.x0, ax.bbox.y1 + 2, fig.bbox.x1, fig.bbox.y1))
+    # Pixel edges of the cells in the canvas buffer (buffer row 0 is the top)
+    canvas_px = np.asarray(fig.canvas.buffer_rgba())
+    col_px = np.rint(ax.transData.transform(
+        [(c - 0.5, 0) for c in range(COLS + 1)])[:, 0]).astype(int)
+    row_px = np.rint(canvas_px.shape[0] - ax.transData.transform(
+        [(0, r - 0.5) for r in range(ROWS + 1)])[:, 1]).astype(int)
+    frames = []
+    for frame in range(total_frames):
+        update(frame)
+        for key, value in dirty:
+            r, c = divmod(key, COLS)
+            block = (slice(row_px[r], row_px[r + 1]), slice(col_px[c], col_px[c + 1]))
+            canvas_px[block] = cell_renders[value][block]
+        dirty.clear()
+        fig.canvas.restore_region(title_background)
+        ax.draw_artist(title)
+        frames.append(Image.fromarray(canvas_px).convert('RGB'))
+    title.set_animated(False)
+    im.set_array(grid)
+    
+    # The last frame, still in full colour, is the final PNG: no second
+    # render of the figure through savefig
+    final_frame = frames[-1]
+    
+    # Map every frame onto one palette taken from the last frame, which
+    # holds every cell colour; the GIF writer would otherwise quantize
+    # each frame from scratch
+    palette = frames[-1].quantize(method=Image.Quantize.MAXCOVERAGE)
+    frames = [f.quantize(palette=palette, dither=Image.Dither.NONE) for f in frames]
+    
+    # Save as GIF (10 fps). Frames are still cropped to the changed
+    # region; optimize=False only skips Pillow's pass that re-fills
+    # unchanged pixels with transparency, which dominated the save time
+    frames[0].save(output_file, save_all=True, append_images=frames[1:],
+                   duration=100, loop=0, optimize=False)
     print(f"✓ Animation saved as: {output_file}")
     
     # Also save final static image
     static_file = 'astar_final.png'
-    plt.savefig(static_file, dpi=150, bbox_inches='tight')
+    final_frame.save(static_file)
     print(f"✓ Final image saved as: {static_file}")
     
     print("\n" + "=" * 80)
@@ -4,22 +4,55 @@ GUI for A* Algorithm Visualization
 Interactive interface for setting parameters and running simulations
 """
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
+from tkinter import ttk, messagebox
 import matplotlib
 matplotlib.use('TkAgg')
-import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.colors import ListedColormap
-from matplotlib.animation import FuncAnimation
+from matplotlib.animation import writers
+from matplotlib.colors import to_rgba_array
+from matplotlib.figure import Figure
 import numpy as np
-import random
-import time
+from PIL import Image, ImageTk
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import os
+import subprocess
 
 from Algo_AStar import AStarPathfinder
 
+# Most frames kept for the saved GIF; longer animations keep every k-th
+# step so the snapshots held in memory stay bounded
+GIF_MAX_FRAMES = 150
+
+# RGBA colour of each cell category, built once for every simulation:
+# 0 empty, 1 obstacle, 2 explored, 3 path, 4 start, 5 goal
+PALETTE = (to_rgba_array(['white', 'black', '#87CEEB', '#00FF00', '#FF0000', '#FFD700'])
+           * 255).astype(np.uint8)
+
+# Frame rate of saved MP4s; every captured frame's display time is a
+# multiple of its 50 ms period
+MP4_FPS = 20
+
+
+def write_mp4(path, frames, durations):
+    """Encode equally sized PIL frames to H.264 with ffmpeg, holding each for its duration in ms"""
+    width, height = frames[-1].size
+    cmd = [matplotlib.rcParams['animation.ffmpeg_path'], '-y', '-loglevel', 'error',
+           '-f', 'rawvideo', '-pix_fmt', 'rgb24', '-s', f'{width}x{height}',
+           '-r', str(MP4_FPS), '-i', '-',
+           # yuv420p needs even dimensions
+           '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2',
+           '-c:v', 'libx264', '-pix_fmt', 'yuv420p', '-threads', '0', path]
+    with subprocess.Popen(cmd, stdin=subprocess.PIPE) as proc:
+        for frame, duration in zip(frames, durations):
+            data = frame.convert('RGB').tobytes()
+            for _ in range(max(1, round(duration * MP4_FPS / 1000))):
+                proc.stdin.write(data)
+        proc.stdin.close()
+    if proc.returncode:
+        raise RuntimeError(f"ffmpeg exited with status {proc.returncode}")
+
 
 class AStarGUI:
     def __init__(self, root):
@@ -36,10 +69,17 @@ class AStarGUI:
         self.goal_col = tk.IntVar(value=9)
         self.min_obstacles = tk.IntVar(value=20)
         self.auto_timestamp = tk.BooleanVar(value=True)
+        self.output_format = tk.StringVar(value="GIF")  # "GIF" or "MP4"
         self.custom_filename = tk.StringVar(value="astar_animation")
         
         # Grid for clicking start/goal
         self.grid_canvas = None
+        self._preview_dims = None  # (rows, cols, cell_size) of the drawn preview grid
+        self._preview_image = None
+        self._markers = None  # (start rect, start text, goal rect, goal text) canvas items
+        self._cell_x = self._cell_y = None  # pixel edge of each preview column / row
+        # Runs obstacle generation and the search off the Tk thread
+        self._executor = ThreadPoolExecutor(max_workers=1)
         self.setting_mode = tk.StringVar(value="none")  # "start", "goal", "none"
         
         self.create_widgets()
@@ -180,6 +220,14 @@ class AStarGUI:
         filename_entry.grid(row=row_idx, column=1, sticky=(tk.W, tk.E), pady=2)
         row_idx += 1
         
+        ttk.Label(left_panel, text="Format:").grid(row=row_idx, column=0, sticky=tk.W, pady=2)
+        format_frame = ttk.Frame(left_panel)
+        format_frame.grid(row=row_idx, column=1, sticky=tk.W, pady=2)
+        for fmt in ("GIF", "MP4"):
+            ttk.Radiobutton(format_frame, text=fmt, value=fmt,
+                            variable=self.output_format).pack(side=tk.LEFT, padx=(0, 8))
+        row_idx += 1
+        
         # Run Button
         ttk.Separator(left_panel, orient='horizontal').grid(row=row_idx, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=15)
         row_idx += 1
@@ -226,26 +274,47 @@ class AStarGUI:
         if self.goal_col.get() >= cols:
             self.goal_col.set(cols - 1)
         
-        # Clear previous canvas
-        for widget in self.canvas_frame.winfo_children():
-            widget.destroy()
-        
-        # Create new canvas
         canvas_size = min(500, 400)
         cell_size = canvas_size // max(rows, cols)
         
-        self.grid_canvas = tk.Canvas(self.canvas_frame, 
-                                     width=cols * cell_size, 
-                                     height=rows * cell_size,
-                                     bg='white', highlightthickness=1, 
-                                     highlightbackground='black')
-        self.grid_canvas.pack()
-        
-        # Draw grid
-        for i in range(rows + 1):
-            self.grid_canvas.create_line(0, i * cell_size, cols * cell_size, i * cell_size, fill='gray')
-        for j in range(cols + 1):
-            self.grid_canvas.create_line(j * cell_size, 0, j * cell_size, rows * cell_size, fill='gray')
+        # Same grid as last time: only the start / goal markers can change
+        dims = (rows, cols, cell_size)
+        if dims == self._preview_dims:
+            self.draw_positions(cell_size)
+            return
+        self._preview_dims = dims
+        
+        # Create the canvas once; a new grid size just clears and resizes it
+        if self.grid_canvas is None:
+            self.grid_canvas = tk.Canvas(self.canvas_frame, bg='white', 
+                                         highlightthickness=1, 
+                                         highlightbackground='black')
+            self.grid_canvas.pack()
+        self.grid_canvas.delete('all')
+        self.grid_canvas.config(width=cols * cell_size, height=rows * cell_size)
+        
+        # Draw grid: the lines are painted into one image (Tk 'gray' on
+        # white) shown as a single canvas item, not rows + cols + 2 lines
+        lines = np.full((rows * cell_size + 1, cols * cell_size + 1, 3), 255, np.uint8)
+        lines[::cell_size] = 190
+        lines[:, ::cell_size] = 190
+        self._preview_image = ImageTk.PhotoImage(Image.fromarray(lines))  # Keep a reference
+        self.grid_canvas.create_image(0, 0, image=self._preview_image, anchor='nw')
+        
+        # Pixel edges of the cells, looked up instead of multiplied per click
+        self._cell_x = range(0, cols * cell_size + 1, cell_size)
+        self._cell_y = range(0, rows * cell_size + 1, cell_size)
+        
+        # Start (red) and goal (yellow) markers are created once per grid;
+        # draw_positions only moves them
+        self._markers = (
+            self.grid_canvas.create_rectangle(0, 0, 0, 0, fill='red', tags='marker'),
+            self.grid_canvas.create_text(0, 0, text='S', font=('Arial', 12, 'bold'),
+                                         fill='white', tags='marker'),
+            self.grid_canvas.create_rectangle(0, 0, 0, 0, fill='gold', tags='marker'),
+            self.grid_canvas.create_text(0, 0, text='G', font=('Arial', 12, 'bold'),
+                                         fill='black', tags='marker'),
+        )
         
         # Draw start and goal
         self.draw_positions(cell_size)
@@ -255,31 +324,21 @@ class AStarGUI:
         
     def draw_positions(self, cell_size):
         """Draw start and goal positions on canvas"""
-        rows = self.rows.get()
-        cols = self.cols.get()
         start = (self.start_row.get(), self.start_col.get())
         goal = (self.goal_row.get(), self.goal_col.get())
-        
-        # Clear previous markers
-        self.grid_canvas.delete('marker')
-        
-        # Draw start (red)
-        x1 = start[1] * cell_size
-        y1 = start[0] * cell_size
-        self.grid_canvas.create_rectangle(x1, y1, x1 + cell_size, y1 + cell_size, 
-                                         fill='red', tags='marker')
-        self.grid_canvas.create_text(x1 + cell_size//2, y1 + cell_size//2, 
-                                     text='S', font=('Arial', 12, 'bold'), 
-                                     fill='white', tags='marker')
-        
-        # Draw goal (yellow)
-        x2 = goal[1] * cell_size
-        y2 = goal[0] * cell_size
-        self.grid_canvas.create_rectangle(x2, y2, x2 + cell_size, y2 + cell_size, 
-                                         fill='gold', tags='marker')
-        self.grid_canvas.create_text(x2 + cell_size//2, y2 + cell_size//2, 
-                                     text='G', font=('Arial', 12, 'bold'), 
-                                     fill='black', tags='marker')
+        start_rect, start_text, goal_rect, goal_text = self._markers
+        
+        # Move start (red)
+        x1 = self._cell_x[start[1]]
+        y1 = self._cell_y[start[0]]
+        self.grid_canvas.coords(start_rect, x1, y1, x1 + cell_size, y1 + cell_size)
+        self.grid_canvas.coords(start_text, x1 + cell_size//2, y1 + cell_size//2)
+        
+        # Move goal (yellow)
+        x2 = self._cell_x[goal[1]]
+        y2 = self._cell_y[goal[0]]
+        self.grid_canvas.coords(goal_rect, x2, y2, x2 + cell_size, y2 + cell_size)
+        self.grid_canvas.coords(goal_text, x2 + cell_size//2, y2 + cell_size//2)
     
     def set_click_mode(self, mode):
         """Set the clicking mode for start/goal"""
@@ -310,35 +369,29 @@ class AStarGUI:
     
     def generate_random_obstacles(self, rows, cols, start, goal, min_obstacles):
         """Generate random obstacles ensuring path exists"""
-        max_attempts = 100
-        
-        for attempt in range(max_attempts):
-            num_obstacles = random.randint(min_obstacles, int(rows * cols * 0.35))
-            obstacles = []
-            
-            while len(obstacles) < num_obstacles:
-                r = random.randint(0, rows - 1)
-                c = random.randint(0, cols - 1)
-                
-                if (r, c) != start and (r, c) != goal and (r, c) not in obstacles:
-                    obstacles.append((r, c))
-            
-            pathfinder = AStarPathfinder((rows, cols), obstacles)
-            result = pathfinder.astar(start, goal)
-            
-            if result['success']:
-                return obstacles, result
-        
-        # Fallback
-        obstacles = []
-        while len(obstacles) < min_obstacles:
-            r = random.randint(0, rows - 1)
-            c = random.randint(0, cols - 1)
-            if (r, c) != start and (r, c) != goal and (r, c) not in obstacles:
-                obstacles.append((r, c))
+        rng = np.random.default_rng()
+        # Keep a random monotone staircase from start to goal free of obstacles:
+        # every layout drawn around it is solvable, so one search is enough and
+        # no retry loop is needed. Its cells are 4-connected, which is a valid
+        # path for both the 4- and 8-direction searches
+        dr, dc = goal[0] - start[0], goal[1] - start[1]
+        moves = np.repeat([[np.sign(dr), 0], [0, np.sign(dc)]], [abs(dr), abs(dc)], axis=0)
+        rng.shuffle(moves)
+        corridor = np.asarray(start) + np.cumsum(moves, axis=0)
+        # Flat indices of every cell off the corridor and not start or goal;
+        # drawing from them without replacement needs no membership tests
+        free = np.setdiff1d(np.arange(rows * cols),
+                            np.r_[start[0] * cols + start[1], corridor[:, 0] * cols + corridor[:, 1]])
+        max_obstacles = min(int(rows * cols * 0.35), free.size)
+        num_obstacles = int(rng.integers(min(min_obstacles, max_obstacles), max_obstacles, endpoint=True))
+        # (num_obstacles, 2) array of (row, col) pairs: the pathfinder and the
+        # animation index their grids with it directly, so the cells never
+        # become Python tuples
+        obstacles = np.column_stack(
+            np.divmod(rng.choice(free, size=num_obstacles, replace=False), cols))
         
         pathfinder = AStarPathfinder((rows, cols), obstacles)
-        result = pathfinder.astar(start, goal)
+        result = pathfinder.astar(start, goal, record_trace=True)
         return obstacles, result
     
     def run_simulation(self):
@@ -355,11 +408,21 @@ class AStarGUI:
             return
         
         self.status_label.config(text="Generating obstacles...", foreground="orange")
-        self.root.update()
+        
+        # Generate obstacles and search on the worker thread so the window
+        # keeps repainting; _poll_simulation opens the result once it is done
+        future = self._executor.submit(self.generate_random_obstacles,
+                                       rows, cols, start, goal, min_obs)
+        self.root.after(50, self._poll_simulation, future, rows, cols, start, goal)
+    
+    def _poll_simulation(self, future, rows, cols, start, goal):
+        """Wait for a submitted simulation, then open its visualization"""
+        if not future.done():
+            self.root.after(50, self._poll_simulation, future, rows, cols, start, goal)
+            return
         
         try:
-            # Generate obstacles
-            obstacles, result = self.generate_random_obstacles(rows, cols, start, goal, min_obs)
+            obstacles, result = future.result()
             
             if not result['success']:
                 messagebox.showerror("Error", "No path found!")
@@ -380,27 +443,38 @@ class AStarGUI:
         """Create and display live animation in GUI window"""
         explored_nodes = result['explored_nodes']
         path_nodes = result['path']
+        # (N, 2) int32 copies: a tick paints its whole slice with one
+        # indexed write instead of unpacking each node tuple
+        explored_arr = np.asarray(explored_nodes, np.int32).reshape(-1, 2)
+        path_arr = np.asarray(path_nodes, np.int32).reshape(-1, 2)
         
         # Create new window for visualization
         viz_window = tk.Toplevel(self.root)
         viz_window.title("A* Algorithm - Live Simulation")
         viz_window.geometry("900x700")
         
-        # Create figure for matplotlib
-        fig, ax = plt.subplots(figsize=(8, 6))
-        
-        colors = ['white', 'black', '#87CEEB', '#00FF00', '#FF0000', '#FFD700']
-        cmap = ListedColormap(colors)
+        # Create figure for matplotlib. A bare Figure rather than
+        # plt.subplots: pyplot would also build its own TkAgg manager (a
+        # second Tk root) for a window that is never shown
+        fig = Figure(figsize=(8, 6))
+        ax = fig.subplots()
         
-        grid = np.zeros((rows, cols))
+        # The image holds RGBA pixels rather than cell categories, so a step
+        # writes the changed cells' colours and no colormap pass runs on
+        # redraw
+        grid = np.empty((rows, cols, 4), np.uint8)
+        grid[:, :] = PALETTE[0]
         
-        for obs in obstacles:
-            grid[obs[0]][obs[1]] = 1
+        grid[obstacles[:, 0], obstacles[:, 1]] = PALETTE[1]
         
-        grid[start[0]][start[1]] = 4
-        grid[goal[0]][goal[1]] = 5
+        grid[start[0], start[1]] = PALETTE[4]
+        grid[goal[0], goal[1]] = PALETTE[5]
         
-        im = ax.imshow(grid, cmap=cmap, interpolation='nearest', origin='upper')
+        im = ax.imshow(grid, interpolation='nearest', origin='upper')
+        # imshow keeps its own copy of the pixels; steps write straight into
+        # that buffer and call im.changed() instead of re-validating the
+        # whole grid through set_array every frame
+        grid = im.get_array().data
         
         ax.set_xticks(np.arange(-0.5, cols, 1), minor=True)
         ax.set_yticks(np.arange(-0.5, rows, 1), minor=True)
@@ -423,18 +497,52 @@ class AStarGUI:
         ax.legend(handles=legend_elements, loc='upper left', bbox_to_anchor=(1.02, 1), 
                   fontsize=9, frameon=True, shadow=True)
         
-        ax.text(start[1], start[0], 'S', ha='center', va='center', 
-                fontsize=10, fontweight='bold', color='white')
-        ax.text(goal[1], goal[0], 'G', ha='center', va='center', 
-                fontsize=10, fontweight='bold', color='black')
+        start_label = ax.text(start[1], start[0], 'S', ha='center', va='center', 
+                              fontsize=10, fontweight='bold', color='white')
+        goal_label = ax.text(goal[1], goal[0], 'G', ha='center', va='center', 
+                             fontsize=10, fontweight='bold', color='black')
         
         title_text = ax.text(0.5, 1.08, 'Initializing...', transform=ax.transAxes,
                             ha='center', fontsize=11, fontweight='bold')
         
-        plt.tight_layout()
+        # Fixed margins rather than a tight_layout pass: the right side holds
+        # the legend and the top the title; the equal-aspect axes shrinks
+        # inside them for any grid shape
+        fig.subplots_adjust(left=0.07, right=0.80, bottom=0.10, top=0.88)
         
         # Embed matplotlib in tkinter
         canvas = FigureCanvasTkAgg(fig, master=viz_window)
+        
+        # Blitting: the image, the artists drawn over it and the title are
+        # animated, so full draws (first show, window resizes) leave them
+        # out of a cached background. A step restores that background and
+        # redraws just these artists instead of re-rendering the figure
+        overlays = [start_label, goal_label, *ax.spines.values()]
+        for artist in (im, title_text, *overlays):
+            artist.set_animated(True)
+        background = [None]
+        gridlines = []
+        
+        def draw_animated():
+            ax.draw_artist(im)
+            # The grid lines belong to the axes' axis artists, which stay
+            # in the background, so they are drawn again over the image
+            for artist in (*gridlines, *overlays, title_text):
+                ax.draw_artist(artist)
+        
+        def on_draw(event):
+            background[0] = canvas.copy_from_bbox(fig.bbox)
+            gridlines[:] = [tick.gridline for axis in (ax.xaxis, ax.yaxis)
+                            for tick in axis.get_minor_ticks()]
+            draw_animated()
+        
+        def refresh():
+            # The title sits above the axes, so the whole figure is blitted
+            canvas.restore_region(background[0])
+            draw_animated()
+            canvas.blit(fig.bbox)
+        
+        draw_cid = canvas.mpl_connect('draw_event', on_draw)
         canvas.draw()
         canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
@@ -450,103 +558,170 @@ class AStarGUI:
         save_btn.pack(side=tk.RIGHT, padx=5)
         
         # Animation state
-        current_frame = [0]
-        animation_phase = [0]  # 0: exploring, 1: showing path
-        is_running = [True]
-        
-        def animate_step():
-            if not is_running[0]:
+        current_frame = [0]  # next node of the running phase
+        pending = [None]  # id of the scheduled tick
+        # Nodes drawn per tick: large searches play back in a few hundred
+        # redraws per phase rather than one redraw per node
+        explore_stride = max(1, len(explored_nodes) // 300)
+        path_stride = max(1, len(path_nodes) // 300)
+        
+        # Canvas snapshots for the saved GIF, quantized to 256 colours as
+        # they are taken (a quarter of the RGB size)
+        n_steps = (-(-len(explored_nodes) // explore_stride)
+                   + -(-len(path_nodes) // path_stride))  # Ceiling divisions
+        capture_every = max(1, -(-n_steps // GIF_MAX_FRAMES))
+        gif_frames = []
+        gif_durations = []  # ms each frame is shown
+        steps_done = [0]
+        
+        def snapshot():
+            frame = Image.fromarray(np.asarray(canvas.buffer_rgba())).convert('RGB')
+            return frame.quantize(method=Image.Quantize.FASTOCTREE)
+        
+        def capture(delay):
+            """Keep every capture_every-th step as a GIF frame"""
+            if steps_done[0] % capture_every == 0:
+                gif_frames.append(snapshot())
+                gif_durations.append(delay * capture_every)
+            steps_done[0] += 1
+        
+        def schedule(delay, tick):
+            pending[0] = viz_window.after(delay, tick)
+        
+        def paint(cells, color):
+            grid[cells[:, 0], cells[:, 1]] = color
+            # Start and goal are in the traces but keep their own colours
+            grid[start[0], start[1]] = PALETTE[4]
+            grid[goal[0], goal[1]] = PALETTE[5]
+        
+        # One tick function per phase, so a tick never checks which phase
+        # is running
+        def explore_tick():
+            i = current_frame[0]
+            if i == len(explored_nodes):
+                # Move to path drawing phase
+                current_frame[0] = 0
+                schedule(500, path_tick)  # Pause before showing path
                 return
             
-            phase = animation_phase[0]
+            end = min(i + explore_stride, len(explored_nodes))
+            paint(explored_arr[i:end], PALETTE[2])
             
-            if phase == 0:  # Exploration phase
-                if current_frame[0] < len(explored_nodes):
-                    node = explored_nodes[current_frame[0]]
-                    if node != start and node != goal:
-                        grid[node[0]][node[1]] = 2
-                    
-                    im.set_array(grid)
-                    title_text.set_text(
-                        f"A* Exploring Nodes - Step {current_frame[0] + 1}/{len(explored_nodes)}"
-                    )
-                    status_var.set(
-                        f"Exploring... {current_frame[0] + 1}/{len(explored_nodes)} nodes | "
-                        f"Obstacles: {len(obstacles)}"
-                    )
-                    canvas.draw()
-                    current_frame[0] += 1
-                    viz_window.after(50, animate_step)  # 50ms delay
-                else:
-                    # Move to path drawing phase
-                    animation_phase[0] = 1
-                    current_frame[0] = 0
-                    viz_window.after(500, animate_step)  # Pause before showing path
+            im.changed()
+            title_text.set_text(
+                f"A* Exploring Nodes - Step {end}/{len(explored_nodes)}"
+            )
+            status_var.set(
+                f"Exploring... {end}/{len(explored_nodes)} nodes | "
+                f"Obstacles: {len(obstacles)}"
+            )
+            refresh()
+            capture(50)
+            current_frame[0] = end
+            schedule(50, explore_tick)  # 50ms delay
+        
+        def path_tick():
+            i = current_frame[0]
+            if i == len(path_nodes):
+                finish()
+                return
+            
+            end = min(i + path_stride, len(path_nodes))
+            paint(path_arr[i:end], PALETTE[3])
             
-            elif phase == 1:  # Path drawing phase
-                if current_frame[0] < len(path_nodes):
-                    node = path_nodes[current_frame[0]]
-                    if node != start and node != goal:
-                        grid[node[0]][node[1]] = 3
-                    
-                    im.set_array(grid)
-                    title_text.set_text(
-                        f"Drawing Optimal Path - Step {current_frame[0] + 1}/{len(path_nodes)}"
-                    )
-                    status_var.set(
-                        f"Drawing path... {current_frame[0] + 1}/{len(path_nodes)} nodes | "
-                        f"Total cost: {len(path_nodes) - 1}"
-                    )
-                    canvas.draw()
-                    current_frame[0] += 1
-                    viz_window.after(100, animate_step)  # Slower for path
-                else:
-                    # Animation complete
-                    is_running[0] = False
-                    title_text.set_text("A* Simulation Complete!")
-                    status_var.set(
-                        f"✓ COMPLETE | Explored: {result['nodes_explored']} | "
-                        f"Path: {result['path_length']} | Time: {result['execution_time_ms']:.2f}ms"
-                    )
-                    canvas.draw()
-                    save_btn.config(state='normal', command=lambda: self.save_animation_files(
-                        fig, result, obstacles, viz_window
-                    ))
-                    self.root.after(0, lambda: self.status_label.config(
-                        text="✓ Simulation complete! Check visualization window.", 
-                        foreground="green"
-                    ))
+            im.changed()
+            title_text.set_text(
+                f"Drawing Optimal Path - Step {end}/{len(path_nodes)}"
+            )
+            status_var.set(
+                f"Drawing path... {end}/{len(path_nodes)} nodes | "
+                f"Total cost: {len(path_nodes) - 1}"
+            )
+            refresh()
+            capture(100)
+            current_frame[0] = end
+            schedule(100, path_tick)  # Slower for path
+        
+        def finish():
+            """Animation complete"""
+            # Back to ordinary full draws for resizing and saving
+            canvas.mpl_disconnect(draw_cid)
+            for artist in (im, title_text, *overlays):
+                artist.set_animated(False)
+            title_text.set_text("A* Simulation Complete!")
+            status_var.set(
+                f"✓ COMPLETE | Explored: {result['nodes_explored']} | "
+                f"Path: {result['path_length']} | Time: {result['execution_time_ms']:.2f}ms"
+            )
+            canvas.draw()
+            gif_frames.append(snapshot())
+            gif_durations.append(2000)  # Hold the final frame
+            save_btn.config(state='normal', command=lambda: self.save_animation_files(
+                fig, result, obstacles, viz_window, gif_frames, gif_durations
+            ))
+            self.root.after(0, lambda: self.status_label.config(
+                text="✓ Simulation complete! Check visualization window.", 
+                foreground="green"
+            ))
         
         # Start animation
-        viz_window.after(500, animate_step)
+        schedule(500, explore_tick)
         
         # Handle window close
         def on_close():
-            is_running[0] = False
-            plt.close(fig)
+            # Cancelling the pending step releases these closures, and with
+            # them the grid, the search result and the captured GIF frames,
+            # now rather than when that step would have fired
+            viz_window.after_cancel(pending[0])
+            canvas.mpl_disconnect(draw_cid)
+            gif_frames.clear()
+            fig.clf()
             viz_window.destroy()
         
         viz_window.protocol("WM_DELETE_WINDOW", on_close)
     
-    def save_animation_files(self, fig, result, obstacles, viz_window):
+    def save_animation_files(self, fig, result, obstacles, viz_window, gif_frames, gif_durations):
         """Save the animation to GIF and PNG files"""
         try:
+            # MP4 goes through ffmpeg's multi-threaded x264 encoder; without
+            # an ffmpeg binary the animation is saved as a GIF instead
+            use_mp4 = self.output_format.get() == "MP4" and writers.is_available('ffmpeg')
+            ext = "mp4" if use_mp4 else "gif"
+            fallback_note = " (ffmpeg not found)" if self.output_format.get() == "MP4" and not use_mp4 else ""
+            
             # Generate filename
             base_filename = self.custom_filename.get()
             if self.auto_timestamp.get():
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                anim_file = f"{base_filename}_{timestamp}.{ext}"
                 final_file = f"{base_filename}_{timestamp}_final.png"
             else:
+                anim_file = f"{base_filename}.{ext}"
                 final_file = f"{base_filename}_final.png"
             
             # Save in the Graphs_Algo directory
+            anim_path = os.path.join(os.path.dirname(__file__), anim_file)
             final_path = os.path.join(os.path.dirname(__file__), final_file)
             
-            fig.savefig(final_path, dpi=150, bbox_inches='tight')
+            # The frames were captured during the live run; a window resize
+            # part way through leaves some at another size
+            size = gif_frames[-1].size
+            frames = [f if f.size == size else f.resize(size) for f in gif_frames]
+            if use_mp4:
+                write_mp4(anim_path, frames, gif_durations)
+            else:
+                frames[0].save(anim_path, save_all=True, append_images=frames[1:],
+                               duration=gif_durations, loop=0, optimize=False)
+            
+            # The canvas already holds the finished figure (finish() drew
+            # it and resizes redraw it in full), so its buffer is written
+            # out as is rather than rendered again through savefig
+            Image.fromarray(np.asarray(fig.canvas.buffer_rgba())).save(final_path)
             
             messagebox.showinfo(
                 "Saved", 
                 f"Visualization saved!\n\n"
+                f"{ext.upper()}: {anim_file}{fallback_note}\n"
                 f"PNG: {final_file}\n\n"
                 f"Path Length: {result['path_length']}\n"
                 f"Nodes Explored: {result['nodes_explored']}\n"
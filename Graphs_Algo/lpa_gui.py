@@ -14,16 +14,18 @@ import matplotlib
 
 matplotlib.use("TkAgg")
 import matplotlib.patches as patches
-import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.colors import ListedColormap
 from matplotlib.figure import Figure
 from matplotlib.lines import Line2D
+from PIL import Image, ImageTk
 
 try:
+    from Algo_AStar import AStarPathfinder
     from Algo_LPA import LPAStarPathfinder
 except ImportError:
+    from .Algo_AStar import AStarPathfinder
     from .Algo_LPA import LPAStarPathfinder
 
 
@@ -50,6 +52,12 @@ class LPAGUI:
 
         self.setting_mode = tk.StringVar(value="none")
         self.grid_canvas: tk.Canvas | None = None
+        # (rows, cols, cell size) the preview grid was last drawn for
+        self._preview_dims: tuple | None = None
+        self._preview_image: ImageTk.PhotoImage | None = None
+        self._markers: tuple[int, int, int, int] | None = None  # start rect/text, goal rect/text
+        self._cell_x: range | None = None  # pixel edge of each preview column
+        self._cell_y: range | None = None  # pixel edge of each preview row
 
         self.create_widgets()
 
@@ -231,26 +239,49 @@ class LPAGUI:
         if self.goal_col.get() >= cols:
             self.goal_col.set(cols - 1)
 
-        for widget in self.canvas_frame.winfo_children():
-            widget.destroy()
-
         canvas_size = min(520, 460)
         cell = max(4, canvas_size // max(rows, cols))
 
-        self.grid_canvas = tk.Canvas(
-            self.canvas_frame,
-            width=cols * cell,
-            height=rows * cell,
-            bg="white",
-            highlightthickness=1,
-            highlightbackground="black",
-        )
-        self.grid_canvas.pack()
+        # Same grid as last time: only the start / goal markers can change
+        dims = (rows, cols, cell)
+        if dims == self._preview_dims:
+            self.draw_positions(cell)
+            return
+        self._preview_dims = dims
 
-        for i in range(rows + 1):
-            self.grid_canvas.create_line(0, i * cell, cols * cell, i * cell, fill="gray")
-        for j in range(cols + 1):
-            self.grid_canvas.create_line(j * cell, 0, j * cell, rows * cell, fill="gray")
+        # Create the canvas once; a new grid size just clears and resizes it
+        if self.grid_canvas is None:
+            self.grid_canvas = tk.Canvas(
+                self.canvas_frame,
+                bg="white",
+                highlightthickness=1,
+                highlightbackground="black",
+            )
+            self.grid_canvas.pack()
+        self.grid_canvas.delete("all")
+        self.grid_canvas.config(width=cols * cell, height=rows * cell)
+
+        # Grid lines painted into one image (Tk "gray" on white) and shown
+        # as a single canvas item instead of rows + cols + 2 line items
+        lines = np.full((rows * cell + 1, cols * cell + 1, 3), 255, np.uint8)
+        lines[::cell] = 190
+        lines[:, ::cell] = 190
+        self._preview_image = ImageTk.PhotoImage(Image.fromarray(lines))
+        self.grid_canvas.create_image(0, 0, image=self._preview_image, anchor="nw")
+
+        # Pixel edges of the cells, looked up instead of multiplied per click
+        self._cell_x = range(0, cols * cell + 1, cell)
+        self._cell_y = range(0, rows * cell + 1, cell)
+
+        # Start / goal markers are created once per grid; draw_positions
+        # only moves them
+        font = ("Arial", 11, "bold")
+        self._markers = (
+            self.grid_canvas.create_rectangle(0, 0, 0, 0, fill="red", tags="marker"),
+            self.grid_canvas.create_text(0, 0, text="S", fill="white", font=font, tags="marker"),
+            self.grid_canvas.create_rectangle(0, 0, 0, 0, fill="gold", tags="marker"),
+            self.grid_canvas.create_text(0, 0, text="G", fill="black", font=font, tags="marker"),
+        )
 
         self.draw_positions(cell)
         self.grid_canvas.bind("<Button-1>", lambda e: self.on_grid_click(e, cell))
@@ -262,33 +293,15 @@ class LPAGUI:
         start = (self.start_row.get(), self.start_col.get())
         goal = (self.goal_row.get(), self.goal_col.get())
 
-        self.grid_canvas.delete("marker")
+        start_rect, start_text, goal_rect, goal_text = self._markers
 
-        sx, sy = start[1] * cell_size, start[0] * cell_size
-        self.grid_canvas.create_rectangle(
-            sx, sy, sx + cell_size, sy + cell_size, fill="red", tags="marker"
-        )
-        self.grid_canvas.create_text(
-            sx + cell_size // 2,
-            sy + cell_size // 2,
-            text="S",
-            fill="white",
-            font=("Arial", 11, "bold"),
-            tags="marker",
-        )
+        sx, sy = self._cell_x[start[1]], self._cell_y[start[0]]
+        self.grid_canvas.coords(start_rect, sx, sy, sx + cell_size, sy + cell_size)
+        self.grid_canvas.coords(start_text, sx + cell_size // 2, sy + cell_size // 2)
 
-        gx, gy = goal[1] * cell_size, goal[0] * cell_size
-        self.grid_canvas.create_rectangle(
-            gx, gy, gx + cell_size, gy + cell_size, fill="gold", tags="marker"
-        )
-        self.grid_canvas.create_text(
-            gx + cell_size // 2,
-            gy + cell_size // 2,
-            text="G",
-            fill="black",
-            font=("Arial", 11, "bold"),
-            tags="marker",
-        )
+        gx, gy = self._cell_x[goal[1]], self._cell_y[goal[0]]
+        self.grid_canvas.coords(goal_rect, gx, gy, gx + cell_size, gy + cell_size)
+        self.grid_canvas.coords(goal_text, gx + cell_size // 2, gy + cell_size // 2)
 
     def set_click_mode(self, mode: str) -> None:
         self.setting_mode.set(mode)
@@ -328,20 +341,26 @@ class LPAGUI:
         max_attempts = 120
         max_obstacles = int(rows * cols * 0.38)
         min_obstacles = min(min_obstacles, max_obstacles)
+        # Every cell but start and goal; random.sample draws distinct cells
+        # from it in one call, with no rejection loop or duplicate checks
+        free = [(r, c) for r in range(rows) for c in range(cols) if (r, c) != start and (r, c) != goal]
+        # A* uses the same eight moves and runs compiled, so unsolvable
+        # layouts are rejected without a pure-Python LPA* plan. One instance
+        # is reset with each layout instead of rebuilt
+        prefilter = AStarPathfinder((rows, cols), [])
 
         for _ in range(max_attempts):
             n_obs = random.randint(min_obstacles, max_obstacles)
-            obs = set()
-            while len(obs) < n_obs:
-                r = random.randint(0, rows - 1)
-                c = random.randint(0, cols - 1)
-                if (r, c) != start and (r, c) != goal:
-                    obs.add((r, c))
-
-            planner = LPAStarPathfinder((rows, cols), list(obs))
+            obs = random.sample(free, n_obs)
+
+            prefilter.reset(obs)
+            if not prefilter.astar(start, goal)["success"]:
+                continue
+
+            planner = LPAStarPathfinder((rows, cols), obs)
             result = planner.plan(start, goal)
             if result["success"]:
-                return list(obs), planner, result
+                return obs, planner, result
 
         fallback = []
         planner = LPAStarPathfinder((rows, cols), fallback)
@@ -449,12 +468,8 @@ class LPAGUI:
 
             replanned_result = planner.apply_obstacle_changes(changes)
 
-            # Rebuild current obstacle list from planner after updates.
-            updated_obstacles = []
-            for r in range(rows):
-                for c in range(cols):
-                    if planner.obstacle_grid[r][c]:
-                        updated_obstacles.append((r, c))
+            # Rebuild current obstacle cells from planner after updates.
+            updated_obstacles = np.argwhere(planner.obstacle_grid)
 
             self.create_animation(
                 rows,
@@ -483,7 +498,7 @@ class LPAGUI:
         start: tuple,
         goal: tuple,
         initial_obstacles: list,
-        updated_obstacles: list,
+        updated_obstacles: np.ndarray,
         changes: list,
         initial_result: dict,
         replanned_result: dict,
@@ -492,21 +507,24 @@ class LPAGUI:
         window.title("LPA* Side-by-Side: Before vs Replanned")
         window.geometry("1280x820")
 
-        fig, (ax_left, ax_right) = plt.subplots(1, 2, figsize=(12.8, 6.8))
+        # A bare Figure rather than plt.subplots: pyplot would also build its
+        # own TkAgg manager (a second Tk root) for a window never shown
+        fig = Figure(figsize=(12.8, 6.8))
+        ax_left, ax_right = fig.subplots(1, 2)
 
         # 0 empty, 1 obstacle, 2 previous explored, 3 previous path,
         # 4 start, 5 goal, 6 new exploration during replan, 7 replanned path.
         colors = ["white", "#2f2f2f", "#9fd2f5", "#7ad67a", "#d93636", "#ffd24d", "#b553d6", "#1f9d4c"]
         cmap = ListedColormap(colors)
 
-        left_grid = np.zeros((rows, cols), dtype=np.int32)
-        right_grid = np.zeros((rows, cols), dtype=np.int32)
-
-        for obs in initial_obstacles:
-            left_grid[obs[0]][obs[1]] = 1
+        left_grid = np.zeros((rows, cols), dtype=np.uint8)
+        right_grid = np.zeros((rows, cols), dtype=np.uint8)
 
-        for obs in updated_obstacles:
-            right_grid[obs[0]][obs[1]] = 1
+        # One indexed write per grid; (N, 2) arrays of (row, col) cells
+        initial_arr = np.asarray(initial_obstacles, dtype=np.intp).reshape(-1, 2)
+        updated_arr = np.asarray(updated_obstacles, dtype=np.intp).reshape(-1, 2)
+        left_grid[initial_arr[:, 0], initial_arr[:, 1]] = 1
+        right_grid[updated_arr[:, 0], updated_arr[:, 1]] = 1
 
         left_grid[start[0]][start[1]] = 4
         left_grid[goal[0]][goal[1]] = 5
@@ -518,6 +536,7 @@ class LPAGUI:
             right_grid, cmap=cmap, interpolation="nearest", origin="upper", vmin=0, vmax=7
         )
 
+        labels = []
         for axis in (ax_left, ax_right):
             axis.set_xticks(np.arange(-0.5, cols, 1), minor=True)
             axis.set_yticks(np.arange(-0.5, rows, 1), minor=True)
@@ -527,10 +546,12 @@ class LPAGUI:
             axis.set_yticks(np.arange(0, rows, 1))
             axis.set_xlabel("Column")
             axis.set_ylabel("Row")
-            axis.text(
+            labels.append(axis.text(
                 start[1], start[0], "S", ha="center", va="center", color="white", fontweight="bold"
+            ))
+            labels.append(
+                axis.text(goal[1], goal[0], "G", ha="center", va="center", color="black", fontweight="bold")
             )
-            axis.text(goal[1], goal[0], "G", ha="center", va="center", color="black", fontweight="bold")
 
         left_title = ax_left.set_title("Before Changes", fontweight="bold")
         right_title = ax_right.set_title("After Changes + Replan", fontweight="bold")
@@ -570,9 +591,52 @@ class LPAGUI:
         ]
         fig.legend(handles=legend_items, loc="lower center", bbox_to_anchor=(0.5, 0.01), ncol=3, fontsize=9)
 
-        plt.tight_layout(rect=(0, 0.08, 1, 1))
+        fig.tight_layout(rect=(0, 0.08, 1, 1))
 
         canvas = FigureCanvasTkAgg(fig, master=window)
+
+        # Blitting: the images, everything drawn over them and the titles
+        # are animated, so full draws (first show, window resizes) leave
+        # them out of a cached background. A step restores that background
+        # and redraws just these artists instead of re-rendering both axes
+        # and the legend
+        animated = [
+            im_left, im_right, left_title, right_title, *labels,
+            *ax_left.spines.values(), *ax_right.spines.values(),
+        ]
+        for artist in animated:
+            artist.set_animated(True)
+        background = [None]
+        gridlines = []
+        marker_artists_left = []
+        marker_artists_right = []
+
+        def draw_animated() -> None:
+            # The grid lines belong to the axes' axis artists, which stay in
+            # the background, so they are drawn again over the images; the
+            # sort keeps a full draw's stacking
+            for artist in sorted(
+                (*animated, *gridlines, *marker_artists_left, *marker_artists_right),
+                key=lambda a: a.get_zorder(),
+            ):
+                fig.draw_artist(artist)
+
+        def on_draw(event) -> None:
+            background[0] = canvas.copy_from_bbox(fig.bbox)
+            gridlines[:] = [
+                tick.gridline
+                for axis in (ax_left.xaxis, ax_left.yaxis, ax_right.xaxis, ax_right.yaxis)
+                for tick in axis.get_minor_ticks()
+            ]
+            draw_animated()
+
+        def refresh() -> None:
+            # The titles sit above the axes, so the whole figure is blitted
+            canvas.restore_region(background[0])
+            draw_animated()
+            canvas.blit(fig.bbox)
+
+        draw_cid = canvas.mpl_connect("draw_event", on_draw)
         canvas.draw()
         canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
 
@@ -628,8 +692,6 @@ class LPAGUI:
         state = {"phase": 0, "idx": 0, "running": True}
         replan_old_count = {"value": 0}
         replan_new_count = {"value": 0}
-        marker_artists_left = []
-        marker_artists_right = []
 
         def draw_change_markers() -> None:
             for artist in marker_artists_left:
@@ -678,6 +740,9 @@ class LPAGUI:
                     )
                 )
 
+            for artist in (*marker_artists_left, *marker_artists_right):
+                artist.set_animated(True)
+
         def step() -> None:
             if not state["running"]:
                 return
@@ -695,7 +760,7 @@ class LPAGUI:
                     status.set(
                         f"Initial expansion {idx + 1}/{len(initial_expanded)} | cost={initial_result['total_cost']:.2f}"
                     )
-                    canvas.draw()
+                    refresh()
                     state["idx"] += 1
                     window.after(30, step)
                     return
@@ -712,7 +777,7 @@ class LPAGUI:
                     im_left.set_array(left_grid)
                     left_title.set_text(f"Before Changes: Path {idx + 1}/{len(initial_path)}")
                     status.set("Drawing initial optimal path")
-                    canvas.draw()
+                    refresh()
                     state["idx"] += 1
                     window.after(70, step)
                     return
@@ -749,7 +814,7 @@ class LPAGUI:
                     f"from unexplored: {len(removed_change_cells) - removed_from_expanded})\n",
                 )
                 calc_text.config(state="disabled")
-                canvas.draw()
+                refresh()
                 state["phase"] = 3
                 state["idx"] = 0
                 window.after(600, step)
@@ -778,7 +843,7 @@ class LPAGUI:
                         f"Replan {idx + 1}/{len(replan_expanded)} | reused={replan_old_count['value']} "
                         f"new={replan_new_count['value']} | {reason}"
                     )
-                    canvas.draw()
+                    refresh()
                     state["idx"] += 1
                     window.after(35, step)
                     return
@@ -795,7 +860,7 @@ class LPAGUI:
                     im_right.set_array(right_grid)
                     right_title.set_text(f"Replanned Path {idx + 1}/{len(replan_path)}")
                     status.set("Drawing replanned path")
-                    canvas.draw()
+                    refresh()
                     state["idx"] += 1
                     window.after(80, step)
                     return
@@ -811,7 +876,13 @@ class LPAGUI:
                     final_status = "Complete: replanning found no path after updates"
                 right_title.set_text("After Changes: Replan Complete")
                 status.set(final_status)
-                canvas.draw()
+                # Back to ordinary full draws for resizing and saving
+                canvas.mpl_disconnect(draw_cid)
+                for artist in (*animated, *marker_artists_left, *marker_artists_right):
+                    artist.set_animated(False)
+                # Nothing reads the canvas right away, so the full draw can
+                # wait for Tk's idle time
+                canvas.draw_idle()
 
                 save_btn.config(
                     state="normal",
@@ -822,7 +893,7 @@ class LPAGUI:
 
         def on_close() -> None:
             state["running"] = False
-            plt.close(fig)
+            fig.clf()
             window.destroy()
 
         window.protocol("WM_DELETE_WINDOW", on_close)